@@ -760,7 +760,7 @@ class QuizQuestionType(enum.StrEnum):
     MULTIPLE_CHOICE = "multiple-choice"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class QuizQuestionMetadata:
     type: QuizQuestionType
     uuid: str
@@ -769,7 +769,7 @@ class QuizQuestionMetadata:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class QuizQuestion:
     inputs: str
     expected_output: str
@@ -860,10 +860,11 @@ class QuizConfig:
 
     @staticmethod
     def _make_question(question: dict) -> QuizQuestion:
+        q_metadata = question["metadata"]
         metadata = QuizQuestionMetadata(
-            uuid=question["metadata"]["uuid"],
-            type=question["metadata"]["type"],
-            options=question["metadata"].get("options", []),
+            uuid=q_metadata["uuid"],
+            type=q_metadata["type"],
+            options=q_metadata.get("options", []),
         )
         return QuizQuestion(
             inputs=question["inputs"],
@@ -887,7 +888,7 @@ class QuizConfig:
                 self._config_path,
             )
 
-        quiz_json = json.loads(self.question_file_path.read_text())
+        quiz_json = json.loads(question_file.read_text())
         return {
             q_dict["metadata"]["uuid"]: self._make_question(q_dict)
             for q_dict in quiz_json["cases"]
@@ -1129,6 +1130,8 @@ SECRET_GETTERS_BY_KIND = {}
 
 
 class _BaseSecretSource:
+    __slots__ = ()
+
     @classmethod
     def from_yaml(cls, config_path: pathlib.Path, config: dict):
         config["_config_path"] = config_path
@@ -1143,7 +1146,7 @@ class _BaseSecretSource:
         }
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EnvVarSecretSource(_BaseSecretSource):
     kind: typing.ClassVar[str] = "env_var"
     secret_name: str
@@ -1159,7 +1162,7 @@ class EnvVarSecretSource(_BaseSecretSource):
         return {"env_var_name": self.env_var_name}
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FilePathSecretSource(_BaseSecretSource):
     kind: typing.ClassVar[str] = "file_path"
     secret_name: str
@@ -1171,7 +1174,7 @@ class FilePathSecretSource(_BaseSecretSource):
         return {"file_path": self.file_path}
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SubprocessSecretSource(_BaseSecretSource):
     kind: typing.ClassVar[str] = "subprocess"
     secret_name: str
@@ -1198,7 +1201,7 @@ class SubprocessSecretSource(_BaseSecretSource):
         }
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RandomCharsSecretSource(_BaseSecretSource):
     kind: typing.ClassVar[str] = "random_chars"
     secret_name: str
@@ -1232,7 +1235,7 @@ SourceClassesByKind = {
 }
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SecretConfig:
     secret_name: str
     sources: SecretSources = None
@@ -1295,6 +1298,10 @@ def _check_is_dict(config_yaml):
     return config_yaml
 
 
+# Use libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _load_config_yaml(config_path: pathlib.Path) -> dict:
     """Load a YAML config file"""
     if not config_path.is_file():
@@ -1303,7 +1310,7 @@ def _load_config_yaml(config_path: pathlib.Path) -> dict:
     try:
         with config_path.open() as stream:
             config_yaml = _check_is_dict(
-                yaml.load(stream, yaml.Loader),
+                yaml.load(stream, _YAML_LOADER),
             )
 
     except Exception as exc:
@@ -1333,15 +1340,21 @@ def _find_configs(
         yield config_file, _load_config_yaml(config_file)
 
     except NoSuchConfig:
-        for sub in sorted(to_search.glob("*")):
-            if sub.is_dir():
-                sub_config = sub / filename_yaml
-                try:
-                    yield sub_config, _load_config_yaml(sub_config)
-                except NoSuchConfig:
-                    continue
-            else:  # pragma: NO COVER
-                pass
+        # 'scandir' reports each entry's type without a separate 'stat'
+        try:
+            with os.scandir(to_search) as entries:
+                sub_names = sorted(
+                    entry.name for entry in entries if entry.is_dir()
+                )
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+
+        for sub_name in sub_names:
+            sub_config = to_search / sub_name / filename_yaml
+            try:
+                yield sub_config, _load_config_yaml(sub_config)
+            except NoSuchConfig:
+                continue
 
 
 _find_room_configs = functools.partial(
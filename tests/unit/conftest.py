@@ -19,12 +19,18 @@ def _auth_systems(n_auth_systems):
     ]
 
 
-@pytest.fixture
-def temp_dir() -> pathlib.Path:
+@pytest.fixture(scope="session")
+def temp_root() -> pathlib.Path:
     with tempfile.TemporaryDirectory() as td:
         yield pathlib.Path(td)
 
 
+@pytest.fixture
+def temp_dir(temp_root) -> pathlib.Path:
+    # Fresh per-test directory, removed with the whole tree at session end
+    return pathlib.Path(tempfile.mkdtemp(dir=temp_root))
+
+
 @pytest.fixture(params=[0, 1, 2])
 def with_auth_systems(request):
     return _auth_systems(request.param)
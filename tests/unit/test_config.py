@@ -4,7 +4,10 @@ import dataclasses
 import functools
 import inspect
 import json
+import os
 import pathlib
+import tempfile
+import types
 from unittest import mock
 from urllib import parse as url_parse
 
@@ -14,6 +17,20 @@ import yaml
 from soliplex import config
 from soliplex import secrets
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.cache
+def _parse_yaml_cached(config_yaml):
+    return yaml.load(config_yaml, Loader=YAML_LOADER)
+
+
+def _parse_yaml(config_yaml):
+    # 'from_yaml' methods mutate the mapping they are passed
+    return copy.deepcopy(_parse_yaml_cached(config_yaml))
+
+
 AUTHSYSTEM_ID = "testing"
 AUTHSYSTEM_TITLE = "Testing OIDC"
 AUTHSYSTEM_SERVER_URL = "https://example.com/auth/realms/sso"
@@ -32,13 +49,15 @@ AUTHSYSTEM_CLIENT_ID = "testing-oidc"
 
 ABSOLUTE_OIDC_CLIENT_PEM_PATH = "/path/to/cacert.pem"
 RELATIVE_OIDC_CLIENT_PEM_PATH = "./cacert.pem"
-BARE_AUTHSYSTEM_CONFIG_KW = {
-    "id": AUTHSYSTEM_ID,
-    "title": AUTHSYSTEM_TITLE,
-    "server_url": AUTHSYSTEM_SERVER_URL,
-    "token_validation_pem": AUTHSYSTEM_TOKEN_VALIDATION_PEM,
-    "client_id": AUTHSYSTEM_CLIENT_ID,
-}
+BARE_AUTHSYSTEM_CONFIG_KW = types.MappingProxyType(
+    {
+        "id": AUTHSYSTEM_ID,
+        "title": AUTHSYSTEM_TITLE,
+        "server_url": AUTHSYSTEM_SERVER_URL,
+        "token_validation_pem": AUTHSYSTEM_TOKEN_VALIDATION_PEM,
+        "client_id": AUTHSYSTEM_CLIENT_ID,
+    }
+)
 BARE_AUTHSYSTEM_CONFIG_YAML = f"""
     id: "{AUTHSYSTEM_ID}"
     title: "{AUTHSYSTEM_TITLE}"
@@ -57,16 +76,19 @@ BARE_AUTHSYSTEM_CONFIG_YAML = f"""
 """
 
 AUTHSYSTEM_SCOPE = "test one two three"
-W_SCOPE_AUTHSYSTEM_CONFIG_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_SCOPE_AUTHSYSTEM_CONFIG_KW["scope"] = AUTHSYSTEM_SCOPE
+W_SCOPE_AUTHSYSTEM_CONFIG_KW = types.MappingProxyType(
+    {**BARE_AUTHSYSTEM_CONFIG_KW, "scope": AUTHSYSTEM_SCOPE}
+)
 W_SCOPE_AUTHSYSTEM_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
     scope: "{AUTHSYSTEM_SCOPE}"
 """
 
-W_PEM_AUTHSYSTEM_CONFIG_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_PEM_AUTHSYSTEM_CONFIG_KW["oidc_client_pem_path"] = (
-    ABSOLUTE_OIDC_CLIENT_PEM_PATH
+W_PEM_AUTHSYSTEM_CONFIG_KW = types.MappingProxyType(
+    {
+        **BARE_AUTHSYSTEM_CONFIG_KW,
+        "oidc_client_pem_path": ABSOLUTE_OIDC_CLIENT_PEM_PATH,
+    }
 )
 W_PEM_AUTHSYSTEM_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
@@ -74,9 +96,11 @@ W_PEM_AUTHSYSTEM_CONFIG_YAML = f"""
 """
 
 AUTHSYSTEM_CLIENT_SECRET_LIT = "REALLY BIG SECRET"
-W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_KW["client_secret"] = (
-    AUTHSYSTEM_CLIENT_SECRET_LIT
+W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_KW = types.MappingProxyType(
+    {
+        **BARE_AUTHSYSTEM_CONFIG_KW,
+        "client_secret": AUTHSYSTEM_CLIENT_SECRET_LIT,
+    }
 )
 W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
@@ -85,9 +109,11 @@ W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_YAML = f"""
 
 CLIENT_SECRET_NAME = "TEST_OIDC_CLIENT_SECRET"
 AUTHSYSTEM_CLIENT_SECRET_SECRET = f"secret:{CLIENT_SECRET_NAME}"
-W_CLIENT_SECRET_SECRET_AUTHSYSTEM_CONFIG_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_CLIENT_SECRET_SECRET_AUTHSYSTEM_CONFIG_KW["client_secret"] = (
-    AUTHSYSTEM_CLIENT_SECRET_SECRET
+W_CLIENT_SECRET_SECRET_AUTHSYSTEM_CONFIG_KW = types.MappingProxyType(
+    {
+        **BARE_AUTHSYSTEM_CONFIG_KW,
+        "client_secret": AUTHSYSTEM_CLIENT_SECRET_SECRET,
+    }
 )
 W_CLIENT_SECRET_SECRET_AUTHSYSTEM_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
@@ -96,16 +122,24 @@ W_CLIENT_SECRET_SECRET_AUTHSYSTEM_CONFIG_YAML = f"""
 
 AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL_NAME = "cacert.pem"
 AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL = "./cacert.pem"
-W_OIDC_CPP_REL_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_OIDC_CPP_REL_KW["oidc_client_pem_path"] = AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL
+W_OIDC_CPP_REL_KW = types.MappingProxyType(
+    {
+        **BARE_AUTHSYSTEM_CONFIG_KW,
+        "oidc_client_pem_path": AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL,
+    }
+)
 W_OIDC_CPP_REL_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
     oidc_client_pem_path: "{AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL}"
 """
 
 AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS = "/path/to/cacert.pem"
-W_OIDC_CPP_ABS_KW = BARE_AUTHSYSTEM_CONFIG_KW.copy()
-W_OIDC_CPP_ABS_KW["oidc_client_pem_path"] = AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS
+W_OIDC_CPP_ABS_KW = types.MappingProxyType(
+    {
+        **BARE_AUTHSYSTEM_CONFIG_KW,
+        "oidc_client_pem_path": AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS,
+    }
+)
 W_OIDC_CPP_ABS_CONFIG_YAML = f"""
 {BARE_AUTHSYSTEM_CONFIG_YAML}
     oidc_client_pem_path: "{AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS}"
@@ -320,18 +354,22 @@ FADTC_CONFIG_KW = {
 
 BOGUS_AGENT_CONFIG_YAML = ""
 
-EMPTY_AGENT_CONFIG_KW = dict(
-    id=AGENT_ID,
+EMPTY_AGENT_CONFIG_KW = types.MappingProxyType(
+    dict(
+        id=AGENT_ID,
+    )
 )
 EMPTY_AGENT_CONFIG_YAML = f"""
 id: "{AGENT_ID}"
 """
 
 
-BARE_AGENT_CONFIG_KW = dict(
-    id=AGENT_ID,
-    system_prompt=SYSTEM_PROMPT,
-    model_name=MODEL_NAME,
+BARE_AGENT_CONFIG_KW = types.MappingProxyType(
+    dict(
+        id=AGENT_ID,
+        system_prompt=SYSTEM_PROMPT,
+        model_name=MODEL_NAME,
+    )
 )
 BARE_AGENT_CONFIG_YAML = f"""
 id: "{AGENT_ID}"
@@ -339,10 +377,12 @@ system_prompt: "{SYSTEM_PROMPT}"
 model_name: "{MODEL_NAME}"
 """
 
-W_PROMPT_FILE_AGENT_CONFIG_KW = dict(
-    id=AGENT_ID,
-    _system_prompt_path="./prompt.txt",
-    model_name=MODEL_NAME,
+W_PROMPT_FILE_AGENT_CONFIG_KW = types.MappingProxyType(
+    dict(
+        id=AGENT_ID,
+        _system_prompt_path="./prompt.txt",
+        model_name=MODEL_NAME,
+    )
 )
 W_PROMPT_FILE_AGENT_CONFIG_YAML = f"""
 id: "{AGENT_ID}"
@@ -350,35 +390,6 @@ system_prompt: ./prompt.txt
 model_name: "{MODEL_NAME}"
 """
 
-Q_UUID_1 = "DEADBEEF"
-QUESTION_1 = "What color is the sky"
-ANSWER_1 = "blue"
-TYPE_1 = "qa"
-
-Q_UUID_2 = "FACEDACE"
-QUESTION_2 = "What color is grass?"
-ANSWER_2 = "green"
-TYPE_2 = "multiple-choice"
-OPTIONS_2 = ["red", "green", "blue"]
-
-QUESTIONS = [
-    config.QuizQuestion(
-        inputs=QUESTION_1,
-        expected_output=ANSWER_1,
-        metadata=config.QuizQuestionMetadata(
-            uuid=Q_UUID_1,
-            type=TYPE_1,
-        ),
-    ),
-    config.QuizQuestion(
-        inputs=QUESTION_2,
-        expected_output=ANSWER_2,
-        metadata=config.QuizQuestionMetadata(
-            type=TYPE_2, uuid=Q_UUID_2, options=OPTIONS_2
-        ),
-    ),
-]
-
 BOGUS_ROOM_CONFIG_YAML = ""
 
 BARE_ROOM_CONFIG_KW = {
@@ -397,6 +408,12 @@ description: "{ROOM_DESCRIPTION}"
 agent:
     system_prompt: "{SYSTEM_PROMPT}"
 """
+BARE_ROOM_CONFIG_YAML_ID_TEMPLATE = BARE_ROOM_CONFIG_YAML.replace(
+    f'id: "{ROOM_ID}"', 'id: "{id}"', 1
+)
+BARE_ROOM_CONFIG_YAML_NAME_TEMPLATE = BARE_ROOM_CONFIG_YAML.replace(
+    f'name: "{ROOM_NAME}"', 'name: "{name}"', 1
+)
 
 FULL_ROOM_CONFIG_KW = {
     "id": ROOM_ID,
@@ -512,6 +529,9 @@ id: "{COMPLETION_ID}"
 agent:
     system_prompt: "{SYSTEM_PROMPT}"
 """
+BARE_COMPLETION_CONFIG_YAML_ID_TEMPLATE = BARE_COMPLETION_CONFIG_YAML.replace(
+    f'id: "{COMPLETION_ID}"', 'id: "{id}"', 1
+)
 
 FULL_COMPLETION_CONFIG_KW = {
     "id": COMPLETION_ID,
@@ -574,6 +594,11 @@ mcp_client_toolsets:
       query_params:
         {HTTP_MCP_QP_KEY}: "{HTTP_MCP_QP_VALUE}"
 """
+FULL_COMPLETION_CONFIG_YAML_NAME_TEMPLATE = (
+    FULL_COMPLETION_CONFIG_YAML.replace(
+        f'name: "{COMPLETION_NAME}"', 'name: "{name}"', 1
+    )
+)
 
 SECRET_NAME = "TEST_SECRET"
 SECRET_VALUE = "DEADBEEF"
@@ -802,6 +827,16 @@ environment:
     {CONFIG_KEY_2}: "{CONFIG_VAL_2}"
 """
 
+
+def _paths_installation_config_yaml(key, *paths):
+    """Render an installation config YAML with a single list of paths
+
+    With no 'paths', the list holds only a null entry.
+    """
+    lines = [f'    - "{path}"' for path in paths] or ["    -"]
+    return "\n".join([f'id: "{INSTALLATION_ID}"', f"{key}:", *lines, ""])
+
+
 OIDC_PATH_1 = "./oidc"
 OIDC_PATH_2 = "/path/to/other/oidc"
 
@@ -812,22 +847,19 @@ W_OIDC_PATHS_INSTALLATION_CONFIG_KW = {
         OIDC_PATH_2,
     ],
 }
-W_OIDC_PATHS_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-oidc_paths:
-    - "{OIDC_PATH_1}"
-    - "{OIDC_PATH_2}"
-"""
+W_OIDC_PATHS_INSTALLATION_CONFIG_YAML = _paths_installation_config_yaml(
+    "oidc_paths",
+    OIDC_PATH_1,
+    OIDC_PATH_2,
+)
 
 W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW = {
     "id": INSTALLATION_ID,
     "oidc_paths": [],
 }
-W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-oidc_paths:
-    -
-"""
+W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = (
+    _paths_installation_config_yaml("oidc_paths")
+)
 
 ROOM_PATH_1 = "./rooms"
 ROOM_PATH_2 = "/path/to/other/rooms"
@@ -839,22 +871,19 @@ W_ROOM_PATHS_INSTALLATION_CONFIG_KW = {
         ROOM_PATH_2,
     ],
 }
-W_ROOM_PATHS_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-room_paths:
-    - "{ROOM_PATH_1}"
-    - "{ROOM_PATH_2}"
-"""
+W_ROOM_PATHS_INSTALLATION_CONFIG_YAML = _paths_installation_config_yaml(
+    "room_paths",
+    ROOM_PATH_1,
+    ROOM_PATH_2,
+)
 
 W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW = {
     "id": INSTALLATION_ID,
     "room_paths": [],
 }
-W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-room_paths:
-    -
-"""
+W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = (
+    _paths_installation_config_yaml("room_paths")
+)
 
 COMPLETION_PATH_1 = "./completions"
 COMPLETION_PATH_2 = "/path/to/other/completions"
@@ -866,22 +895,19 @@ W_COMPLETION_PATHS_INSTALLATION_CONFIG_KW = {
         COMPLETION_PATH_2,
     ],
 }
-W_COMPLETION_PATHS_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-completion_paths:
-    - "{COMPLETION_PATH_1}"
-    - "{COMPLETION_PATH_2}"
-"""
+W_COMPLETION_PATHS_INSTALLATION_CONFIG_YAML = _paths_installation_config_yaml(
+    "completion_paths",
+    COMPLETION_PATH_1,
+    COMPLETION_PATH_2,
+)
 
 W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW = {
     "id": INSTALLATION_ID,
     "completion_paths": [],
 }
-W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-completion_paths:
-    -
-"""
+W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = (
+    _paths_installation_config_yaml("completion_paths")
+)
 
 QUIZZES_PATH_1 = "./quizzes"
 QUIZZES_PATH_2 = "/path/to/other/quizzes"
@@ -893,22 +919,19 @@ W_QUIZZES_PATHS_INSTALLATION_CONFIG_KW = {
         QUIZZES_PATH_2,
     ],
 }
-W_QUIZZES_PATHS_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-quizzes_paths:
-    - "{QUIZZES_PATH_1}"
-    - "{QUIZZES_PATH_2}"
-"""
+W_QUIZZES_PATHS_INSTALLATION_CONFIG_YAML = _paths_installation_config_yaml(
+    "quizzes_paths",
+    QUIZZES_PATH_1,
+    QUIZZES_PATH_2,
+)
 
 W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW = {
     "id": INSTALLATION_ID,
     "quizzes_paths": [],
 }
-W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = f"""\
-id: "{INSTALLATION_ID}"
-quizzes_paths:
-    -
-"""
+W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML = (
+    _paths_installation_config_yaml("quizzes_paths")
+)
 
 AGENT_CONFIG_ID = "agent-config-1"
 
@@ -931,11 +954,24 @@ agent_configs:
 """
 
 
-@pytest.fixture
-def installation_config():
+@pytest.fixture(scope="module")
+def shared_installation_config():
     return mock.create_autospec(config.InstallationConfig)
 
 
+@pytest.fixture
+def installation_config(shared_installation_config):
+    yield shared_installation_config
+    shared_installation_config.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def yaml_file(temp_dir, config_yaml):
+    yaml_file = temp_dir / "test.yaml"
+    yaml_file.write_text(config_yaml)
+    return yaml_file
+
+
 def test_authsystem_from_yaml_w_error(
     installation_config,
     temp_dir,
@@ -943,8 +979,7 @@ def test_authsystem_from_yaml_w_error(
     config_path = temp_dir / "config.yaml"
     config_path.write_text(W_ERROR_AUTHSYSTM_CONFIG_YAML)
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(W_ERROR_AUTHSYSTM_CONFIG_YAML)
 
     with pytest.raises(config.FromYamlException) as exc_info:
         config.OIDCAuthSystemConfig.from_yaml(
@@ -959,37 +994,32 @@ def test_authsystem_from_yaml_w_error(
 @pytest.mark.parametrize(
     "config_yaml, exp_config",
     [
-        (BARE_AUTHSYSTEM_CONFIG_YAML, BARE_AUTHSYSTEM_CONFIG_KW.copy()),
-        (W_SCOPE_AUTHSYSTEM_CONFIG_YAML, W_SCOPE_AUTHSYSTEM_CONFIG_KW.copy()),
-        (W_PEM_AUTHSYSTEM_CONFIG_YAML, W_PEM_AUTHSYSTEM_CONFIG_KW.copy()),
+        (BARE_AUTHSYSTEM_CONFIG_YAML, BARE_AUTHSYSTEM_CONFIG_KW),
+        (W_SCOPE_AUTHSYSTEM_CONFIG_YAML, W_SCOPE_AUTHSYSTEM_CONFIG_KW),
+        (W_PEM_AUTHSYSTEM_CONFIG_YAML, W_PEM_AUTHSYSTEM_CONFIG_KW),
     ],
 )
 def test_authsystem_from_yaml(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     exp_config,
 ):
-    expected = config.OIDCAuthSystemConfig(
-        _installation_config=installation_config,
-        **exp_config,
-    )
-
-    config_path = temp_dir / "config.yaml"
-    config_path.write_text(config_yaml)
+    config_path = yaml_file
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
+    exp_config = dict(exp_config)
     oidc_client_pem_path = exp_config.get("oidc_client_pem_path")
 
     if oidc_client_pem_path is not None:
-        expected = dataclasses.replace(
-            expected,
-            oidc_client_pem_path=pathlib.Path(oidc_client_pem_path),
-        )
+        exp_config["oidc_client_pem_path"] = pathlib.Path(oidc_client_pem_path)
 
-    expected._config_path = config_path
+    expected = config.OIDCAuthSystemConfig(
+        _installation_config=installation_config,
+        _config_path=config_path,
+        **exp_config,
+    )
 
     found = config.OIDCAuthSystemConfig.from_yaml(
         installation_config,
@@ -1017,16 +1047,14 @@ def test_authsystem_from_yaml(
 )
 def test_authsystem_from_yaml_w_client_secret(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     exp_config,
     exp_secret,
 ):
-    config_path = temp_dir / "config.yaml"
-    config_path.write_text(config_yaml)
+    config_path = yaml_file
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     expected = config.OIDCAuthSystemConfig(
         _installation_config=installation_config,
@@ -1047,10 +1075,13 @@ def test_authsystem_from_yaml_w_client_secret(
 @pytest.mark.parametrize(
     "exp_config, exp_path",
     [
-        (W_OIDC_CPP_REL_KW, "{temp_dir}/{rel_name}"),
+        (
+            W_OIDC_CPP_REL_KW,
+            lambda td: td / AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL_NAME,
+        ),
         (
             W_OIDC_CPP_ABS_KW,
-            AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS,
+            lambda td: pathlib.Path(AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_ABS),
         ),
     ],
 )
@@ -1065,20 +1096,12 @@ def test_authsystem_from_yaml_w_oid_cpp(
         **exp_config,
     )
     config_path = expected._config_path = temp_dir / "config.yaml"
-
-    if exp_path.startswith("{"):
-        kwargs = {
-            "temp_dir": temp_dir,
-            "rel_name": AUTHSYSTEM_OIDC_CLIENT_PEM_PATH_REL_NAME,
-        }
-        exp_path = exp_path.format(**kwargs)
-
-    expected.oidc_client_pem_path = pathlib.Path(exp_path)
+    expected.oidc_client_pem_path = exp_path(temp_dir)
 
     found = config.OIDCAuthSystemConfig.from_yaml(
         installation_config,
         config_path,
-        exp_config,
+        dict(exp_config),
     )
 
     assert found == expected
@@ -1095,7 +1118,7 @@ def test_authsystem_server_metadata_url():
 @pytest.mark.parametrize(
     "w_config, exp_client_kwargs, exp_secret, bare_secret",
     [
-        (BARE_AUTHSYSTEM_CONFIG_KW.copy(), {}, "", True),
+        (BARE_AUTHSYSTEM_CONFIG_KW, {}, "", True),
         (
             W_CLIENT_SECRET_LIT_AUTHSYSTEM_CONFIG_KW,
             {},
@@ -1211,7 +1234,7 @@ def test_toolconfig_tool_id():
 
 
 @pytest.mark.parametrize("w_existing", [False, True])
-def test_toolconfig_tool(w_existing):
+def test_toolconfig_tool(monkeypatch, w_existing):
     def existing():  # pragma: NO COVER
         pass
 
@@ -1228,8 +1251,8 @@ def test_toolconfig_tool(w_existing):
             tool_name="soliplex.tools.test_tool",
         )
 
-    with mock.patch.dict("soliplex.tools.__dict__", test_tool=test_tool):
-        found = tool_config.tool
+    monkeypatch.setattr("soliplex.tools.test_tool", test_tool, raising=False)
+    found = tool_config.tool
 
     if w_existing:
         assert found is existing
@@ -1289,25 +1312,33 @@ def TEST_TOOL_WO_CTX_W_PARAM_W_TC(
     "This is a test"
 
 
+@pytest.fixture
+def patched_tool(request, monkeypatch):
+    monkeypatch.setattr(
+        "soliplex.tools.test_tool", request.param, raising=False
+    )
+    return request.param
+
+
 @pytest.mark.parametrize(
-    "test_tool",
+    "patched_tool",
     [
         TEST_TOOL_W_CTX_WO_PARAM_W_TC,
         TEST_TOOL_W_CTX_W_PARAM_W_TC,
     ],
+    indirect=True,
 )
-def test_toolconfig_tool_requires_w_conflict(test_tool):
+def test_toolconfig_tool_requires_w_conflict(patched_tool):
     tool_config = config.ToolConfig(
         tool_name="soliplex.tools.test_tool",
     )
 
-    with mock.patch.dict("soliplex.tools.__dict__", test_tool=test_tool):
-        with pytest.raises(config.ToolRequirementConflict):
-            _ = tool_config.tool_requires
+    with pytest.raises(config.ToolRequirementConflict):
+        _ = tool_config.tool_requires
 
 
 @pytest.mark.parametrize(
-    "test_tool",
+    "patched_tool",
     [
         TEST_TOOL_W_CTX_WO_PARAM_WO_TC,
         TEST_TOOL_W_CTX_W_PARAM_WO_TC,
@@ -1316,20 +1347,20 @@ def test_toolconfig_tool_requires_w_conflict(test_tool):
         TEST_TOOL_WO_CTX_WO_PARAM_W_TC,
         TEST_TOOL_WO_CTX_W_PARAM_W_TC,
     ],
+    indirect=True,
 )
-def test_toolconfig_tool_description(test_tool):
+def test_toolconfig_tool_description(patched_tool):
     tool_config = config.ToolConfig(
         tool_name="soliplex.tools.test_tool",
     )
 
-    with mock.patch.dict("soliplex.tools.__dict__", test_tool=test_tool):
-        found = tool_config.tool_description
+    found = tool_config.tool_description
 
-    assert found == test_tool.__doc__.strip()
+    assert found == patched_tool.__doc__.strip()
 
 
 @pytest.mark.parametrize(
-    "test_tool, expected",
+    "patched_tool, expected",
     [
         (TEST_TOOL_W_CTX_WO_PARAM_WO_TC, config.ToolRequires.FASTAPI_CONTEXT),
         (TEST_TOOL_W_CTX_W_PARAM_WO_TC, config.ToolRequires.FASTAPI_CONTEXT),
@@ -1338,20 +1369,20 @@ def test_toolconfig_tool_description(test_tool):
         (TEST_TOOL_WO_CTX_WO_PARAM_W_TC, config.ToolRequires.TOOL_CONFIG),
         (TEST_TOOL_WO_CTX_W_PARAM_W_TC, config.ToolRequires.TOOL_CONFIG),
     ],
+    indirect=["patched_tool"],
 )
-def test_toolconfig_tool_requires(test_tool, expected):
+def test_toolconfig_tool_requires(patched_tool, expected):
     tool_config = config.ToolConfig(
         tool_name="soliplex.tools.test_tool",
     )
 
-    with mock.patch.dict("soliplex.tools.__dict__", test_tool=test_tool):
-        found = tool_config.tool_requires
+    found = tool_config.tool_requires
 
     assert found == expected
 
 
 @pytest.mark.parametrize(
-    "test_tool, exp_wrapped",
+    "patched_tool, exp_wrapped",
     [
         (TEST_TOOL_W_CTX_WO_PARAM_WO_TC, False),
         (TEST_TOOL_W_CTX_W_PARAM_WO_TC, False),
@@ -1360,28 +1391,30 @@ def test_toolconfig_tool_requires(test_tool, expected):
         (TEST_TOOL_WO_CTX_WO_PARAM_W_TC, True),
         (TEST_TOOL_WO_CTX_W_PARAM_W_TC, True),
     ],
+    indirect=["patched_tool"],
 )
-def test_toolconfig_tool_with_config(test_tool, exp_wrapped):
+def test_toolconfig_tool_with_config(patched_tool, exp_wrapped):
     tool_config = config.ToolConfig(
         tool_name="soliplex.tools.test_tool",
     )
 
-    with mock.patch.dict("soliplex.tools.__dict__", test_tool=test_tool):
-        found = tool_config.tool_with_config
+    found = tool_config.tool_with_config
 
     if exp_wrapped:
         assert isinstance(found, functools.partial)
-        assert found.func is test_tool
+        assert found.func is patched_tool
         assert found.keywords == {"tool_config": tool_config}
-        assert found.__name__ == test_tool.__name__
-        assert found.__doc__ == test_tool.__doc__
+        assert found.__name__ == patched_tool.__name__
+        assert found.__doc__ == patched_tool.__doc__
 
-        exp_signature = inspect.signature(test_tool)
-        for param in found.__signature__.parameters:
-            assert param in exp_signature.parameters
+        exp_signature = inspect.signature(patched_tool)
+        assert (
+            found.__signature__.parameters.keys()
+            <= exp_signature.parameters.keys()
+        )
 
     else:
-        assert found is test_tool
+        assert found is patched_tool
 
 
 def test_toolconfig_get_extra_parameters():
@@ -1392,6 +1425,22 @@ def test_toolconfig_get_extra_parameters():
     assert tool_config.get_extra_parameters() == {}
 
 
+DEFAULT_SDTC_EXTRA_PARAMETERS = types.MappingProxyType(
+    {
+        "expand_context_radius": 2,
+        "search_documents_limit": 5,
+        "return_citations": False,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def db_rag_path(temp_root):
+    db_rag_path = pathlib.Path(tempfile.mkdtemp(dir=temp_root)) / "db" / "rag"
+    db_rag_path.mkdir(parents=True)
+    return db_rag_path
+
+
 @pytest.mark.parametrize(
     "stem, override, which",
     [
@@ -1401,10 +1450,14 @@ def test_toolconfig_get_extra_parameters():
         (None, "./override", "override"),
     ],
 )
-def test_sdtc_ctor(installation_config, temp_dir, stem, override, which):
-    db_rag_path = temp_dir / "db" / "rag"
-    db_rag_path.mkdir(parents=True)
-
+def test_sdtc_ctor(
+    installation_config,
+    temp_dir,
+    db_rag_path,
+    stem,
+    override,
+    which,
+):
     if which is None:
         expectation = pytest.raises(config.RagDbExactlyOneOfStemOrOverride)
     else:
@@ -1412,7 +1465,7 @@ def test_sdtc_ctor(installation_config, temp_dir, stem, override, which):
 
     if stem is not None:
         from_stem = db_rag_path / f"{stem}.lancedb"
-        from_stem.mkdir()
+        from_stem.mkdir(exist_ok=True)
 
     if override is not None:
         override = temp_dir / override
@@ -1421,7 +1474,7 @@ def test_sdtc_ctor(installation_config, temp_dir, stem, override, which):
             from_override.mkdir()
 
     ic_environ = {"RAG_LANCE_DB_PATH": str(db_rag_path)}
-    installation_config.get_environment = ic_environ.get
+    installation_config.get_environment.side_effect = ic_environ.get
 
     kw = {"_installation_config": installation_config}
 
@@ -1443,13 +1496,11 @@ def test_sdtc_ctor(installation_config, temp_dir, stem, override, which):
         assert sdt_config._config_path is None
 
         found = sdt_config.rag_lancedb_path
-        assert found.resolve() == expected.resolve()
+        assert os.path.samefile(found, expected)
 
         expected_ep = {
             "rag_lancedb_path": expected,
-            "expand_context_radius": 2,
-            "search_documents_limit": 5,
-            "return_citations": False,
+            **DEFAULT_SDTC_EXTRA_PARAMETERS,
         }
 
         assert sdt_config.get_extra_parameters() == expected_ep
@@ -1466,14 +1517,12 @@ def test_sdtc_ctor(installation_config, temp_dir, stem, override, which):
 def test_sdtc_from_yaml(
     installation_config,
     temp_dir,
+    db_rag_path,
     config_yaml,
     exp_config,
 ):
-    db_rag_dir = temp_dir / "db" / "rag"
-    db_rag_dir.mkdir(parents=True)
-
-    ic_environ = {"RAG_LANCE_DB_PATH": str(db_rag_dir)}
-    installation_config.get_environment = ic_environ.get
+    ic_environ = {"RAG_LANCE_DB_PATH": str(db_rag_path)}
+    installation_config.get_environment.side_effect = ic_environ.get
 
     config_dir = temp_dir / "rooms" / "test_room"
     config_dir.mkdir(parents=True)
@@ -1481,8 +1530,7 @@ def test_sdtc_from_yaml(
     config_path = config_dir / "room_config.yaml"
     config_path.write_text(config_yaml)
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     if exp_config is None:
         with pytest.raises(config.FromYamlException) as exc:
@@ -1520,15 +1568,13 @@ def test_sdtc_from_yaml(
 def test_sdtc_rag_lance_db_path(
     installation_config,
     temp_dir,
+    db_rag_path,
     stem,
     override,
     which,
 ):
-    db_rag_path = temp_dir / "db" / "rag"
-    db_rag_path.mkdir(parents=True)
-
     ic_environ = {"RAG_LANCE_DB_PATH": str(db_rag_path)}
-    installation_config.get_environment = ic_environ.get
+    installation_config.get_environment.side_effect = ic_environ.get
 
     kw = {}
 
@@ -1536,7 +1582,7 @@ def test_sdtc_rag_lance_db_path(
         kw["rag_lancedb_stem"] = stem
         from_stem = db_rag_path / f"{stem}.lancedb"
         if stem != "nonesuch":
-            from_stem.mkdir()
+            from_stem.mkdir(exist_ok=True)
             expected = from_stem
             expectation = contextlib.nullcontext()
         else:
@@ -1568,7 +1614,7 @@ def test_sdtc_rag_lance_db_path(
         found = sdt_config.rag_lancedb_path
 
     if expected is not None:
-        assert found.resolve() == expected.resolve()
+        assert os.path.samefile(found, expected)
 
 
 @pytest.mark.parametrize(
@@ -1591,8 +1637,7 @@ def test_stdio_mctc_from_yaml(
     config_path = config_dir / "room_config.yaml"
     config_path.write_text(config_yaml)
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     if exp_config is None:
         with pytest.raises(config.FromYamlException) as exc:
@@ -1649,17 +1694,14 @@ def test_stdio_mctc_tool_kwargs(installation_config, w_env):
     assert found["args"] == stdio_mctc.args
     assert found["allowed_tools"] == stdio_mctc.allowed_tools
 
-    for (f_key, f_val), (cfg_key, cfg_value) in zip(
-        found["env"].items(),
-        w_env.items(),
-        strict=True,
-    ):
-        assert f_key == cfg_key
-        assert f_val is installation_config.get_secret.return_value
-        assert (
-            mock.call(cfg_value)
-            in installation_config.get_secret.call_args_list
-        )
+    assert found["env"] == {
+        cfg_key: installation_config.get_secret.return_value
+        for cfg_key in w_env
+    }
+    installation_config.get_secret.assert_has_calls(
+        [mock.call(cfg_value) for cfg_value in w_env.values()],
+        any_order=True,
+    )
 
 
 @pytest.mark.parametrize(
@@ -1682,8 +1724,7 @@ def test_http_mctc_from_yaml(
     config_path = config_dir / "room_config.yaml"
     config_path.write_text(config_yaml)
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     if exp_config is None:
         with pytest.raises(config.FromYamlException) as exc:
@@ -1748,37 +1789,30 @@ def test_http_mctc_tool_kwargs(
     assert found["allowed_tools"] == http_mctc.allowed_tools
 
     if w_query_params:
-        base, qs = found["url"].split("?")
-        assert base == http_mctc.url
-
-        qp_dict = dict(url_parse.parse_qsl(qs))
-
-        for (f_key, f_val), (cfg_key, cfg_value) in zip(
-            qp_dict.items(),
-            w_query_params.items(),
-            strict=True,
-        ):
-            assert f_key == cfg_key
-            assert f_val == installation_config.get_secret.return_value
-            assert (
-                mock.call(cfg_value)
-                in installation_config.get_secret.call_args_list
-            )
+        exp_qs = url_parse.urlencode(
+            {
+                cfg_key: installation_config.get_secret.return_value
+                for cfg_key in w_query_params
+            }
+        )
+        assert found["url"] == f"{http_mctc.url}?{exp_qs}"
+
+        installation_config.get_secret.assert_has_calls(
+            [mock.call(cfg_value) for cfg_value in w_query_params.values()],
+            any_order=True,
+        )
 
     else:
         assert found["url"] == http_mctc.url
 
-    for (f_key, f_val), (cfg_key, cfg_value) in zip(
-        found["headers"].items(),
-        w_headers.items(),
-        strict=True,
-    ):
-        assert f_key == cfg_key
-        assert f_val is installation_config.interpolate_secret.return_value
-        assert (
-            mock.call(cfg_value)
-            in installation_config.interpolate_secret.call_args_list
-        )
+    assert found["headers"] == {
+        cfg_key: installation_config.interpolate_secret.return_value
+        for cfg_key in w_headers
+    }
+    installation_config.interpolate_secret.assert_has_calls(
+        [mock.call(cfg_value) for cfg_value in w_headers.values()],
+        any_order=True,
+    )
 
 
 def test_noargsmcpwrapper_call():
@@ -1808,11 +1842,12 @@ def test_withquerymcpwrapper_call():
 @pytest.mark.parametrize(
     "kw",
     [
-        EMPTY_AGENT_CONFIG_KW.copy(),
-        BARE_AGENT_CONFIG_KW.copy(),
+        EMPTY_AGENT_CONFIG_KW,
+        BARE_AGENT_CONFIG_KW,
     ],
 )
 def test_agentconfig_ctor(installation_config, kw):
+    kw = dict(kw)
     kw["_installation_config"] = installation_config
 
     found = config.AgentConfig(**kw)
@@ -1830,25 +1865,18 @@ def test_agentconfig_ctor(installation_config, kw):
     "config_yaml, expected_kw",
     [
         (BOGUS_AGENT_CONFIG_YAML, None),
-        (EMPTY_AGENT_CONFIG_YAML, EMPTY_AGENT_CONFIG_KW.copy()),
-        (BARE_AGENT_CONFIG_YAML, BARE_AGENT_CONFIG_KW.copy()),
-        (
-            W_PROMPT_FILE_AGENT_CONFIG_YAML,
-            W_PROMPT_FILE_AGENT_CONFIG_KW.copy(),
-        ),
+        (EMPTY_AGENT_CONFIG_YAML, EMPTY_AGENT_CONFIG_KW),
+        (BARE_AGENT_CONFIG_YAML, BARE_AGENT_CONFIG_KW),
+        (W_PROMPT_FILE_AGENT_CONFIG_YAML, W_PROMPT_FILE_AGENT_CONFIG_KW),
     ],
 )
 def test_agentconfig_from_yaml(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     expected_kw,
 ):
-    yaml_file = temp_dir / "test.yaml"
-    yaml_file.write_text(config_yaml)
-
-    with yaml_file.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     if expected_kw is None:
         with pytest.raises(config.FromYamlException):
@@ -1858,10 +1886,8 @@ def test_agentconfig_from_yaml(
                 config_dict,
             )
     else:
-        expected = config.AgentConfig(**expected_kw)
-
-        expected = dataclasses.replace(
-            expected,
+        expected = config.AgentConfig(
+            **expected_kw,
             _installation_config=installation_config,
             _config_path=yaml_file,
         )
@@ -1879,9 +1905,9 @@ def test_agentconfig_from_yaml(
 @pytest.mark.parametrize(
     "agent_config_kw",
     [
-        EMPTY_AGENT_CONFIG_KW.copy(),
-        BARE_AGENT_CONFIG_KW.copy(),
-        W_PROMPT_FILE_AGENT_CONFIG_KW.copy(),
+        EMPTY_AGENT_CONFIG_KW,
+        BARE_AGENT_CONFIG_KW,
+        W_PROMPT_FILE_AGENT_CONFIG_KW,
     ],
 )
 def test_agentconfig_get_system_prompt(
@@ -1889,7 +1915,7 @@ def test_agentconfig_get_system_prompt(
     agent_config_kw,
     w_config_path,
 ):
-    agent_config_kw = agent_config_kw.copy()
+    agent_config_kw = dict(agent_config_kw)
 
     if w_config_path:
         config_path = temp_dir / "prompt.txt"
@@ -1929,7 +1955,7 @@ def test_agentconfig_llm_provider_kw(
     has_pk,
 ):
     ic_environ = {"OLLAMA_BASE_URL": OLLAMA_BASE_URL}
-    installation_config.get_environment = ic_environ.get
+    installation_config.get_environment.side_effect = ic_environ.get
 
     kw = {"_installation_config": installation_config}
 
@@ -1967,9 +1993,9 @@ def test_agentconfig_llm_provider_kw(
 @pytest.mark.parametrize(
     "agent_config_kw",
     [
-        EMPTY_AGENT_CONFIG_KW.copy(),
-        BARE_AGENT_CONFIG_KW.copy(),
-        W_PROMPT_FILE_AGENT_CONFIG_KW.copy(),
+        EMPTY_AGENT_CONFIG_KW,
+        BARE_AGENT_CONFIG_KW,
+        W_PROMPT_FILE_AGENT_CONFIG_KW,
     ],
 )
 def test_agentconfig_as_yaml(
@@ -1978,13 +2004,13 @@ def test_agentconfig_as_yaml(
     has_base_url,
     has_pk,
 ):
-    agent_config_kw = copy.deepcopy(agent_config_kw)
+    agent_config_kw = dict(agent_config_kw)
 
     ic_environ = {
         "OLLAMA_BASE_URL": OLLAMA_BASE_URL,
         "DEFAULT_AGENT_MODEL": MODEL_NAME,
     }
-    installation_config.get_environment = ic_environ.get
+    installation_config.get_environment.side_effect = ic_environ.get
     agent_config_kw["_installation_config"] = installation_config
 
     system_prompt = (
@@ -2021,7 +2047,7 @@ def test_agentconfig_as_yaml(
     installation_config.get_secret.assert_not_called()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def qa_question():
     return config.QuizQuestion(
         inputs=INPUTS,
@@ -2034,7 +2060,7 @@ def qa_question():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mc_question():
     return config.QuizQuestion(
         inputs=INPUTS,
@@ -2047,24 +2073,29 @@ def mc_question():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def quiz_questions(qa_question, mc_question):
     return [qa_question, mc_question]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def quiz_json(quiz_questions):
     return {
         "cases": [dataclasses.asdict(question) for question in quiz_questions]
     }
 
 
+@pytest.fixture(scope="module")
+def quiz_json_text(quiz_json):
+    return json.dumps(quiz_json)
+
+
 @pytest.fixture
-def populated_quiz(temp_dir, quiz_json):
+def populated_quiz(temp_dir, quiz_json_text):
     quizzes_path = temp_dir / "quizzes"
     quizzes_path.mkdir()
     populated_quiz = quizzes_path / f"{TEST_QUIZ_ID}.json"
-    populated_quiz.write_text(json.dumps(quiz_json))
+    populated_quiz.write_text(quiz_json_text)
     return populated_quiz
 
 
@@ -2091,6 +2122,7 @@ def test_quizconfig_ctor_exclusive():
     ],
 )
 def test_quizconfig_ctor_w_question_file(
+    monkeypatch,
     installation_config,
     temp_dir,
     qf,
@@ -2107,7 +2139,7 @@ def test_quizconfig_ctor_w_question_file(
         qf_in_qp2 = qp_2 / "foo.json"
         qf_in_qp2.write_text("{}")
 
-    installation_config.quizzes_paths = [qp_1, qp_2]
+    monkeypatch.setattr(installation_config, "quizzes_paths", [qp_1, qp_2])
 
     qc = config.QuizConfig(
         id=TEST_QUIZ_ID,
@@ -2154,12 +2186,11 @@ def test_quizconfig_from_yaml_exceptions(installation_config, temp_dir):
 )
 def test_quizconfig_from_yaml(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     expected_kw,
 ):
-    yaml_file = temp_dir / "test.yaml"
-    yaml_file.write_text(config_yaml)
+    expected_kw = copy.deepcopy(expected_kw)
 
     jac = expected_kw.pop("judge_agent")
 
@@ -2173,16 +2204,13 @@ def test_quizconfig_from_yaml(
 
     expected_kw["judge_agent"] = config.AgentConfig(**jac)
 
-    expected = config.QuizConfig(**expected_kw)
-
-    expected = dataclasses.replace(
-        expected,
+    expected = config.QuizConfig(
+        **expected_kw,
         _installation_config=installation_config,
         _config_path=yaml_file,
     )
 
-    with yaml_file.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     found = config.QuizConfig.from_yaml(
         installation_config,
@@ -2194,10 +2222,11 @@ def test_quizconfig_from_yaml(
 
 
 def test_quizconfig__load_questions_file_miss_w_stem(
+    monkeypatch,
     installation_config,
     temp_dir,
 ):
-    installation_config.quizzes_paths = [temp_dir]
+    monkeypatch.setattr(installation_config, "quizzes_paths", [temp_dir])
     qc = config.QuizConfig(
         id=TEST_QUIZ_ID,
         question_file="nonesuch",
@@ -2222,9 +2251,7 @@ def test_quizconfig__load_questions_file_miss_w_override(
         qc._load_questions_file()
 
 
-def test_quizconfig__load_questions_file(temp_dir, populated_quiz, quiz_json):
-    expected_questions = quiz_json["cases"]
-
+def test_quizconfig__load_questions_file(populated_quiz, quiz_questions):
     qc = config.QuizConfig(
         id=TEST_QUIZ_ID,
         question_file=str(populated_quiz),
@@ -2232,17 +2259,7 @@ def test_quizconfig__load_questions_file(temp_dir, populated_quiz, quiz_json):
 
     found = qc.get_questions()
 
-    for f_question, e_question in zip(
-        found,
-        expected_questions,
-        strict=True,
-    ):
-        assert f_question.inputs == e_question["inputs"]
-        assert f_question.expected_output == e_question["expected_output"]
-        assert f_question.metadata.type == e_question["metadata"]["type"]
-        assert f_question.metadata.uuid == e_question["metadata"]["uuid"]
-        options = e_question["metadata"].get("options")
-        assert f_question.metadata.options == options
+    assert found == quiz_questions
 
 
 @pytest.mark.parametrize("w_max_questions", [None, 1])
@@ -2329,15 +2346,11 @@ def test_quizconfig_get_question(w_loaded, w_miss):
 )
 def test_roomconfig_from_yaml(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     expected_kw,
 ):
-    yaml_file = temp_dir / "test.yaml"
-    yaml_file.write_text(config_yaml)
-
-    with yaml_file.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     if expected_kw is None:
         with pytest.raises(config.FromYamlException) as exc:
@@ -2349,9 +2362,8 @@ def test_roomconfig_from_yaml(
         assert exc.value._config_path == yaml_file
 
     else:
-        expected = config.RoomConfig(**expected_kw)
-        expected = dataclasses.replace(
-            expected,
+        expected = config.RoomConfig(
+            **expected_kw,
             _installation_config=installation_config,
             _config_path=yaml_file,
         )
@@ -2404,8 +2416,8 @@ def test_roomconfig_from_yaml(
 def test_roomconfig_quiz_map(w_existing):
     NUM_QUIZZES = 3
     quizzes = [
-        mock.create_autospec(
-            config.QuizConfig,
+        mock.NonCallableMock(
+            spec=config.QuizConfig,
             id=f"quiz-{iq}",
             question_file=f"ignored-{iq}.json",
         )
@@ -2426,12 +2438,7 @@ def test_roomconfig_quiz_map(w_existing):
         assert found is existing
 
     else:
-        for (_f_id, f_quiz), e_quiz in zip(
-            found.items(),
-            quizzes,
-            strict=True,
-        ):
-            assert f_quiz is e_quiz
+        assert found == {quiz.id: quiz for quiz in quizzes}
 
 
 @pytest.mark.parametrize("w_order", [False, True])
@@ -2494,7 +2501,7 @@ def test_roomconfig_get_logo_image(temp_dir, room_config_kw, w_config_path):
 )
 def test_completionconfig_from_yaml(
     installation_config,
-    temp_dir,
+    yaml_file,
     config_yaml,
     expected_kw,
 ):
@@ -2502,12 +2509,8 @@ def test_completionconfig_from_yaml(
         expected_kw = expected_kw.copy()
         expected_kw["name"] = expected_kw["id"]
 
-    expected = config.CompletionConfig(**expected_kw)
-
-    yaml_file = temp_dir / "test.yaml"
-    yaml_file.write_text(config_yaml)
-    expected = dataclasses.replace(
-        expected,
+    expected = config.CompletionConfig(
+        **expected_kw,
         _installation_config=installation_config,
         _config_path=yaml_file,
     )
@@ -2527,8 +2530,7 @@ def test_completionconfig_from_yaml(
             mcts_config._installation_config = installation_config
             mcts_config._config_path = yaml_file
 
-    with yaml_file.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     found = config.CompletionConfig.from_yaml(
         installation_config,
@@ -2792,34 +2794,54 @@ def test__find_configs_w_single(temp_dir):
     assert found == [(config_file, expected)]
 
 
-def test__find_configs_w_multiple(temp_dir):
-    THING_IDS = ["foo", "bar", "baz", "qux"]
+def test__find_configs_wo_to_search(temp_dir):
+    CONFIG_FILENAME = "config.yaml"
+    to_search = temp_dir / "nonesuch"
+
+    found = list(config._find_configs(to_search, CONFIG_FILENAME))
+
+    assert found == []
+
+
+def test__find_configs_w_unreadable_to_search(monkeypatch, temp_dir):
     CONFIG_FILENAME = "config.yaml"
 
-    expected_things = []
+    def _scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+
+    found = list(config._find_configs(temp_dir, CONFIG_FILENAME))
+
+    assert found == []
 
-    for thing_id in sorted(THING_IDS):
-        thing_path = temp_dir / thing_id
-        if thing_id == "baz":  # file, not dir
-            thing_path.write_text("DEADBEEF")
-        elif thing_id == "qux":  # empty dir
-            thing_path.mkdir()
+
+def test__find_configs_w_multiple(temp_dir):
+    CONFIG_FILENAME = "config.yaml"
+    LAYOUT = [
+        (f".hidden/{CONFIG_FILENAME}", "id: .hidden"),
+        (f"bar/{CONFIG_FILENAME}", "id: bar"),
+        ("baz", "DEADBEEF"),  # file, not dir
+        (f"foo/{CONFIG_FILENAME}", "id: foo"),
+        ("qux", None),  # empty dir
+    ]
+
+    for rel_path, content in LAYOUT:
+        path = temp_dir / rel_path
+        if content is None:
+            path.mkdir()
         else:
-            thing_path.mkdir()
-            config_file = thing_path / CONFIG_FILENAME
-            config_file.write_text(f"id: {thing_id}")
-            expected_thing = {"id": thing_id}
-            expected_things.append((config_file, expected_thing))
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(content)
+
+    expected_things = [
+        (temp_dir / thing_id / CONFIG_FILENAME, {"id": thing_id})
+        for thing_id in [".hidden", "bar", "foo"]
+    ]
 
     found_things = list(config._find_configs(temp_dir, CONFIG_FILENAME))
 
-    for (f_key, f_thing), (e_key, e_thing) in zip(
-        sorted(found_things),
-        sorted(expected_things),
-        strict=True,
-    ):
-        assert f_key == e_key
-        assert f_thing == e_thing
+    assert sorted(found_things) == sorted(expected_things)
 
 
 NoRaise = contextlib.nullcontext()
@@ -2919,11 +2941,14 @@ def test_resolve_environment_entry(
     dotenv_env,
     osenv_patch,
     expectation,
+    monkeypatch,
 ):
-    with (
-        mock.patch.dict("os.environ", **osenv_patch),
-        expectation as expected,
-    ):
+    monkeypatch.delenv(env_name, raising=False)
+
+    for key, value in osenv_patch.items():
+        monkeypatch.setenv(key, value)
+
+    with expectation as expected:
         found = config.resolve_environment_entry(
             env_name,
             env_value,
@@ -3043,18 +3068,14 @@ def patched_soliplex_config():
     ],
 )
 def test_installationconfigmeta_from_yaml(
-    temp_dir,
+    yaml_file,
     patched_soliplex_config,
     config_yaml,
     expected_kw,
 ):
     expected_kw = copy.deepcopy(expected_kw)
 
-    yaml_file = temp_dir / "config.yaml"
-    yaml_file.write_text(config_yaml)
-
-    with yaml_file.open() as fp:
-        config_dict = yaml.safe_load(fp)
+    config_dict = _parse_yaml(config_yaml)
 
     config_meta = config_dict["meta"]
 
@@ -3196,8 +3217,8 @@ def test_installationconfigmeta_as_yaml(
 
 def test_installationconfig_secrets_map_wo_existing():
     secrets = [
-        mock.create_autospec(
-            config.SecretConfig,
+        mock.NonCallableMock(
+            spec=config.SecretConfig,
             secret_name=f"secret-{i_secret}",
         )
         for i_secret in range(5)
@@ -3207,12 +3228,7 @@ def test_installationconfig_secrets_map_wo_existing():
 
     found = i_config.secrets_map
 
-    for (_f_key, f_val), secret in zip(
-        sorted(found.items()),
-        secrets,
-        strict=True,
-    ):
-        assert f_val is secret
+    assert found == {secret.secret_name: secret for secret in secrets}
 
 
 def test_installationconfig_secrets_map_w_existing():
@@ -3422,16 +3438,13 @@ def test_installationconfig_agent_configs_map_wo_existing():
 
     found = i_config.agent_configs_map
 
-    for (_f_key, f_val), agent_config in zip(
-        sorted(found.items()),
-        agent_configs,
-        strict=True,
-    ):
-        exp_agent_config = dataclasses.replace(
+    assert found == {
+        agent_config.id: dataclasses.replace(
             agent_config,
             _installation_config=i_config,
         )
-        assert f_val == exp_agent_config
+        for agent_config in agent_configs
+    }
 
 
 def test_installationconfig_agent_configs_map_w_existing():
@@ -3455,77 +3468,76 @@ def test_installationconfig_agent_configs_map_w_existing():
         ),
         (
             BARE_INSTALLATION_CONFIG_YAML,
-            BARE_INSTALLATION_CONFIG_KW.copy(),
+            BARE_INSTALLATION_CONFIG_KW,
         ),
         (
             W_BARE_META_INSTALLATION_CONFIG_YAML,
-            W_BARE_META_INSTALLATION_CONFIG_KW.copy(),
+            W_BARE_META_INSTALLATION_CONFIG_KW,
         ),
         (
             W_FULL_META_INSTALLATION_CONFIG_YAML,
-            W_FULL_META_INSTALLATION_CONFIG_KW.copy(),
+            W_FULL_META_INSTALLATION_CONFIG_KW,
         ),
         (
             W_SECRETS_INSTALLATION_CONFIG_YAML,
-            W_SECRETS_INSTALLATION_CONFIG_KW.copy(),
+            W_SECRETS_INSTALLATION_CONFIG_KW,
         ),
         (
             W_ENVIRONMENT_LIST_INSTALLATION_CONFIG_YAML,
-            W_ENVIRONMENT_INSTALLATION_CONFIG_KW.copy(),
+            W_ENVIRONMENT_INSTALLATION_CONFIG_KW,
         ),
         (
             W_ENVIRONMENT_MAPPING_INSTALLATION_CONFIG_YAML,
-            W_ENVIRONMENT_INSTALLATION_CONFIG_KW.copy(),
+            W_ENVIRONMENT_INSTALLATION_CONFIG_KW,
         ),
         (
             W_OIDC_PATHS_INSTALLATION_CONFIG_YAML,
-            W_OIDC_PATHS_INSTALLATION_CONFIG_KW.copy(),
+            W_OIDC_PATHS_INSTALLATION_CONFIG_KW,
         ),
         (
             W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML,
-            W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW.copy(),
+            W_OIDC_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW,
         ),
         (
             W_ROOM_PATHS_INSTALLATION_CONFIG_YAML,
-            W_ROOM_PATHS_INSTALLATION_CONFIG_KW.copy(),
+            W_ROOM_PATHS_INSTALLATION_CONFIG_KW,
         ),
         (
             W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML,
-            W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW.copy(),
+            W_ROOM_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW,
         ),
         (
             W_COMPLETION_PATHS_INSTALLATION_CONFIG_YAML,
-            W_COMPLETION_PATHS_INSTALLATION_CONFIG_KW.copy(),
+            W_COMPLETION_PATHS_INSTALLATION_CONFIG_KW,
         ),
         (
             W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML,
-            W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW.copy(),
+            W_COMPLETION_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW,
         ),
         (
             W_QUIZZES_PATHS_INSTALLATION_CONFIG_YAML,
-            W_QUIZZES_PATHS_INSTALLATION_CONFIG_KW.copy(),
+            W_QUIZZES_PATHS_INSTALLATION_CONFIG_KW,
         ),
         (
             W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_YAML,
-            W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW.copy(),
+            W_QUIZZES_PATHS_ONLY_NULL_INSTALLATION_CONFIG_KW,
         ),
         (
             W_AGENT_CONFIG_INSTALLATION_CONFIG_YAML,
-            W_AGENT_CONFIG_INSTALLATION_CONFIG_KW.copy(),
+            W_AGENT_CONFIG_INSTALLATION_CONFIG_KW,
         ),
     ],
 )
 def test_installationconfig_from_yaml(
-    temp_dir,
+    yaml_file,
     patched_soliplex_config,
     config_yaml,
     expected_kw,
 ):
-    config_path = temp_dir / "installation.yaml"
-    config_path.write_text(config_yaml)
+    config_path = yaml_file
+    temp_dir = config_path.parent
 
-    with config_path.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
     expected_kw = copy.deepcopy(expected_kw)
 
@@ -3547,44 +3559,32 @@ def test_installationconfig_from_yaml(
                 _config_path=config_path,
             )
 
-        expected = config.InstallationConfig(
-            **expected_kw,
-            _config_path=config_path,
-        )
-
         if "secrets" in expected_kw:
-            replaced_secrets = []
-            for secret in expected.secrets:
-                replaced_sources = [
-                    dataclasses.replace(source, _config_path=config_path)
-                    for source in secret.sources
-                ]
-                replaced_secrets.append(
-                    dataclasses.replace(
-                        secret,
-                        sources=replaced_sources,
-                        _config_path=config_path,
-                    )
+            expected_kw["secrets"] = [
+                dataclasses.replace(
+                    secret,
+                    sources=[
+                        dataclasses.replace(source, _config_path=config_path)
+                        for source in secret.sources
+                    ],
+                    _config_path=config_path,
                 )
-            expected = dataclasses.replace(expected, secrets=replaced_secrets)
-
-        if "oidc_paths" in expected_kw:
-            exp_oidc_paths = [
-                temp_dir / oidc_path for oidc_path in expected_kw["oidc_paths"]
+                for secret in expected_kw["secrets"]
             ]
-        else:
-            exp_oidc_paths = [temp_dir / "oidc"]
-
-        expected = dataclasses.replace(expected, oidc_paths=exp_oidc_paths)
 
-        if "room_paths" in expected_kw:
-            exp_room_paths = [
-                temp_dir / room_path for room_path in expected_kw["room_paths"]
-            ]
-        else:
-            exp_room_paths = [temp_dir / "rooms"]
+        expected_kw["oidc_paths"] = [
+            temp_dir / oidc_path
+            for oidc_path in expected_kw.get("oidc_paths", ["oidc"])
+        ]
+        expected_kw["room_paths"] = [
+            temp_dir / room_path
+            for room_path in expected_kw.get("room_paths", ["rooms"])
+        ]
 
-        expected = dataclasses.replace(expected, room_paths=exp_room_paths)
+        expected = config.InstallationConfig(
+            **expected_kw,
+            _config_path=config_path,
+        )
 
         found = config.InstallationConfig.from_yaml(config_path, config_dict)
 
@@ -3626,33 +3626,33 @@ environment:
         W_ENVIRONMENT_MAPPING_NO_VALUE_INSTALLATION_CONFIG_YAML,
     ],
 )
-def test_installationconfig_from_yaml_environ_wo_value(temp_dir, config_yaml):
+def test_installationconfig_from_yaml_environ_wo_value(
+    temp_dir,
+    config_yaml,
+    monkeypatch,
+):
     TEST_VALUE = "test value"
 
     yaml_file = temp_dir / "installation.yaml"
     yaml_file.write_text(config_yaml)
 
-    expected_kw = copy.deepcopy(BARE_INSTALLATION_CONFIG_KW)
-    expected_kw["environment"] = {"TEST_ENVVAR": None}
-    expected = config.InstallationConfig(**expected_kw)
-    expected = dataclasses.replace(
-        expected,
-        _config_path=yaml_file,
-        meta=dataclasses.replace(
-            expected.meta,
-            _config_path=yaml_file,
-        ),
+    expected = config.InstallationConfig(
+        **BARE_INSTALLATION_CONFIG_KW,
+        environment={"TEST_ENVVAR": None},
+        meta=config.InstallationConfigMeta(_config_path=yaml_file),
         oidc_paths=[temp_dir / "oidc"],
         room_paths=[temp_dir / "rooms"],
         completion_paths=[temp_dir / "completions"],
         quizzes_paths=[temp_dir / "quizzes"],
+        _config_path=yaml_file,
     )
 
-    with yaml_file.open() as stream:
-        config_dict = yaml.safe_load(stream)
+    config_dict = _parse_yaml(config_yaml)
 
-    with mock.patch.dict("os.environ", clear=True, TEST_ENVVAR=TEST_VALUE):
-        found = config.InstallationConfig.from_yaml(yaml_file, config_dict)
+    # Only 'TEST_ENVVAR' is visible, as with a cleared 'os.environ'
+    monkeypatch.setattr(os, "environ", {"TEST_ENVVAR": TEST_VALUE})
+
+    found = config.InstallationConfig.from_yaml(yaml_file, config_dict)
 
     assert found == expected
 
@@ -3730,7 +3730,7 @@ def test_installationconfig_oidc_auth_system_configs_wo_existing(
         exp_oidc_client_pem_path = pathlib.Path(w_pem_path)
 
     bare_config_yaml = {
-        "auth_systems": [BARE_AUTHSYSTEM_CONFIG_KW.copy()],
+        "auth_systems": [dict(BARE_AUTHSYSTEM_CONFIG_KW)],
     }
 
     if w_pem == "bare_top":
@@ -3743,7 +3743,7 @@ def test_installationconfig_oidc_auth_system_configs_wo_existing(
         exp_oidc_client_pem_path = None
 
     w_scope_config_yaml = {
-        "auth_systems": [W_SCOPE_AUTHSYSTEM_CONFIG_KW.copy()],
+        "auth_systems": [dict(W_SCOPE_AUTHSYSTEM_CONFIG_KW)],
     }
 
     lcy.side_effect = [bare_config_yaml, w_scope_config_yaml]
@@ -3754,16 +3754,18 @@ def test_installationconfig_oidc_auth_system_configs_wo_existing(
     oidc_w_scope_path = temp_dir / "oidc_w_scope"
     oidc_w_scope_config = oidc_w_scope_path / "config.yaml"
 
-    oidc_bare_kw = BARE_AUTHSYSTEM_CONFIG_KW.copy()
+    oidc_bare_kw = dict(BARE_AUTHSYSTEM_CONFIG_KW)
     oidc_bare_kw["oidc_client_pem_path"] = exp_oidc_client_pem_path
     oidc_bare_kw["_config_path"] = oidc_bare_config
 
-    oidc_w_scope_kw = W_SCOPE_AUTHSYSTEM_CONFIG_KW.copy()
+    oidc_w_scope_kw = dict(W_SCOPE_AUTHSYSTEM_CONFIG_KW)
     oidc_w_scope_kw["oidc_client_pem_path"] = None
     oidc_w_scope_kw["_config_path"] = oidc_w_scope_config
 
-    i_config_kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    i_config_kw["oidc_paths"] = [oidc_bare_path, oidc_w_scope_path]
+    i_config_kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "oidc_paths": [oidc_bare_path, oidc_w_scope_path],
+    }
 
     i_config = config.InstallationConfig(**i_config_kw)
 
@@ -3780,15 +3782,16 @@ def test_installationconfig_oidc_auth_system_configs_wo_existing(
 
     found = i_config.oidc_auth_system_configs
 
-    for f_asc, e_asc in zip(found, expected, strict=True):
-        assert f_asc == e_asc
+    assert found == expected
 
 
 def test_installationconfig_oidc_auth_system_configs_w_existing():
     OASC_1, OASC_2 = object(), object()
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_oidc_auth_system_configs"] = [OASC_1, OASC_2]
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_oidc_auth_system_configs": [OASC_1, OASC_2],
+    }
 
     i_config = config.InstallationConfig(**kw)
 
@@ -3800,23 +3803,18 @@ def test_installationconfig_oidc_auth_system_configs_w_existing():
 def test_installationconfig_room_configs_wo_existing(temp_dir):
     ROOM_IDS = ["foo", "bar"]
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_config_path"] = temp_dir / "installation.yaml"
-    kw["environment"] = BARE_INSTALLATION_CONFIG_ENVIRONMENT
-
-    rooms = temp_dir / "rooms"
-    rooms.mkdir()
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_config_path": temp_dir / "installation.yaml",
+        "environment": BARE_INSTALLATION_CONFIG_ENVIRONMENT,
+    }
 
     for room_id in ROOM_IDS:
-        room_path = rooms / room_id
-        room_path.mkdir()
+        room_path = temp_dir / "rooms" / room_id
+        room_path.mkdir(parents=True)
         room_config = room_path / "room_config.yaml"
         room_config.write_text(
-            BARE_ROOM_CONFIG_YAML.replace(
-                f'id: "{ROOM_ID}"',
-                f'id: "{room_id}"',
-                1,
-            ),
+            BARE_ROOM_CONFIG_YAML_ID_TEMPLATE.format(id=room_id),
         )
 
     i_config = config.InstallationConfig(**kw)
@@ -3830,22 +3828,20 @@ def test_installationconfig_room_configs_wo_existing(temp_dir):
 def test_installationconfig_room_configs_wo_existing_w_conflict(temp_dir):
     ROOM_PATHS = ["./foo", "./bar"]
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_config_path"] = temp_dir / "installation.yaml"
-    kw["environment"] = BARE_INSTALLATION_CONFIG_ENVIRONMENT
-    kw["room_paths"] = ROOM_PATHS
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_config_path": temp_dir / "installation.yaml",
+        "environment": BARE_INSTALLATION_CONFIG_ENVIRONMENT,
+        "room_paths": ROOM_PATHS,
+    }
 
     for room_path in ROOM_PATHS:
         room_path = temp_dir / room_path
         room_path.mkdir()
         room_config = room_path / "room_config.yaml"
         room_config.write_text(
-            BARE_ROOM_CONFIG_YAML.replace(
-                # f'id: "{ROOM_ID}"', f'id: "{room_id}"', 1, # conflict on ID
-                f'name: "{ROOM_NAME}"',
-                f'name: "{room_path.name}"',
-                1,
-            )
+            # Same ID in each:  conflict
+            BARE_ROOM_CONFIG_YAML_NAME_TEMPLATE.format(name=room_path.name),
         )
 
     i_config = config.InstallationConfig(**kw)
@@ -3861,8 +3857,10 @@ def test_installationconfig_room_configs_w_existing():
     RC_1, RC_2 = object(), object()
     existing = {"room_1": RC_1, "room_2": RC_2}
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_room_configs"] = existing
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_room_configs": existing,
+    }
 
     i_config = config.InstallationConfig(**kw)
 
@@ -3875,23 +3873,18 @@ def test_installationconfig_room_configs_w_existing():
 def test_installationconfig_completion_configs_wo_existing(temp_dir):
     COMPLETION_IDS = ["foo", "bar"]
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_config_path"] = temp_dir / "installation.yaml"
-    kw["environment"] = BARE_INSTALLATION_CONFIG_ENVIRONMENT
-
-    completions = temp_dir / "completions"
-    completions.mkdir()
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_config_path": temp_dir / "installation.yaml",
+        "environment": BARE_INSTALLATION_CONFIG_ENVIRONMENT,
+    }
 
     for completion_id in COMPLETION_IDS:
-        completion_path = completions / completion_id
-        completion_path.mkdir()
+        completion_path = temp_dir / "completions" / completion_id
+        completion_path.mkdir(parents=True)
         completion_config = completion_path / "completion_config.yaml"
         completion_config.write_text(
-            BARE_COMPLETION_CONFIG_YAML.replace(
-                f'id: "{COMPLETION_ID}"',
-                f'id: "{completion_id}"',
-                1,
-            ),
+            BARE_COMPLETION_CONFIG_YAML_ID_TEMPLATE.format(id=completion_id),
         )
 
     i_config = config.InstallationConfig(**kw)
@@ -3907,24 +3900,22 @@ def test_installationconfig_completion_configs_wo_existing_w_conflict(
 ):
     COMPLETION_PATHS = ["./foo", "./bar"]
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_config_path"] = temp_dir / "installation.yaml"
-    kw["environment"] = BARE_INSTALLATION_CONFIG_ENVIRONMENT
-    kw["completion_paths"] = COMPLETION_PATHS
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_config_path": temp_dir / "installation.yaml",
+        "environment": BARE_INSTALLATION_CONFIG_ENVIRONMENT,
+        "completion_paths": COMPLETION_PATHS,
+    }
 
     for completion_path in COMPLETION_PATHS:
         completion_path = temp_dir / completion_path
         completion_path.mkdir()
         completion_config = completion_path / "completion_config.yaml"
         completion_config.write_text(
-            FULL_COMPLETION_CONFIG_YAML.replace(
-                # f'id: "{COMPLETION_ID}"',
-                # f'id: "{completion_id}"',
-                # 1, # conflict on ID
-                f'name: "{COMPLETION_NAME}"',
-                f'name: "{completion_path.name}"',
-                1,
-            )
+            # Same ID in each:  conflict
+            FULL_COMPLETION_CONFIG_YAML_NAME_TEMPLATE.format(
+                name=completion_path.name,
+            ),
         )
 
     i_config = config.InstallationConfig(**kw)
@@ -3940,8 +3931,10 @@ def test_installationconfig_completion_configs_w_existing():
     CC_1, CC_2 = object(), object()
     existing = {"completion_1": CC_1, "completion_2": CC_2}
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_completion_configs"] = existing
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_completion_configs": existing,
+    }
 
     i_config = config.InstallationConfig(**kw)
 
@@ -3954,53 +3947,46 @@ def test_installationconfig_completion_configs_w_existing():
 def test_installationconfig_reload_configurations():
     existing = object()
 
-    kw = BARE_INSTALLATION_CONFIG_KW.copy()
-    kw["_oidc_auth_system_configs"] = existing
-    kw["_room_configs"] = existing
-    kw["_completion_configs"] = existing
+    kw = {
+        **BARE_INSTALLATION_CONFIG_KW,
+        "_oidc_auth_system_configs": existing,
+        "_room_configs": existing,
+        "_completion_configs": existing,
+    }
     i_config = config.InstallationConfig(**kw)
 
-    with mock.patch.multiple(
-        i_config,
-        _load_oidc_auth_system_configs=mock.DEFAULT,
-        _load_room_configs=mock.DEFAULT,
-        _load_completion_configs=mock.DEFAULT,
-    ) as patched:
-        i_config.reload_configurations()
-
-    assert (
-        i_config._oidc_auth_system_configs
-        is patched["_load_oidc_auth_system_configs"].return_value
-    )
-
-    assert i_config._room_configs is patched["_load_room_configs"].return_value
+    # 'i_config' is local to this test, so the loaders need no restoring.
+    i_config._load_oidc_auth_system_configs = load_oidc = mock.Mock()
+    i_config._load_room_configs = load_rooms = mock.Mock()
+    i_config._load_completion_configs = load_completions = mock.Mock()
 
-    assert (
-        i_config._completion_configs
-        is patched["_load_completion_configs"].return_value
-    )
+    i_config.reload_configurations()
 
+    assert i_config._oidc_auth_system_configs is load_oidc.return_value
+    assert i_config._room_configs is load_rooms.return_value
+    assert i_config._completion_configs is load_completions.return_value
 
-@pytest.fixture
-def populated_temp_dir(temp_dir):
-    default = temp_dir / "installation.yaml"
-    default.write_text('id: "testing"')
 
-    not_a_yaml_file = temp_dir / "not_a_yaml_file.yaml"
-    not_a_yaml_file.write_bytes(b"\xde\xad\xbe\xef")
+@pytest.fixture(scope="module")
+def populated_temp_dir(temp_root):
+    # 'load_installation' only reads, so the tree can be shared.
+    temp_dir = pathlib.Path(tempfile.mkdtemp(dir=temp_root))
 
-    there_but_no_config = temp_dir / "there-but-no-config"
-    there_but_no_config.mkdir()
-
-    there_with_config = temp_dir / "there-with-config"
-    there_with_config.mkdir()
-    there_with_config_filename = there_with_config / "installation.yaml"
-    there_with_config_filename.write_text('id: "there-with-config"')
+    LAYOUT = [
+        ("installation.yaml", b'id: "testing"'),
+        ("not_a_yaml_file.yaml", b"\xde\xad\xbe\xef"),
+        ("there-but-no-config", None),  # empty dir
+        ("there-with-config/installation.yaml", b'id: "there-with-config"'),
+        ("alt-config/filename.yaml", b'id: "alt-config"'),
+    ]
 
-    alt_config = temp_dir / "alt-config"
-    alt_config.mkdir()
-    alt_config_filename = alt_config / "filename.yaml"
-    alt_config_filename.write_text('id: "alt-config"')
+    for rel_path, content in LAYOUT:
+        path = temp_dir / rel_path
+        if content is None:
+            path.mkdir()
+        else:
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(content)
 
     return temp_dir
 
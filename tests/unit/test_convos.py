@@ -118,23 +118,32 @@ text_part = ai_messages.TextPart(content=TEXT)
 thinking_part = ai_messages.ThinkingPart(content=THINKING)
 tool_call_part = ai_messages.ToolCallPart(tool_name=TOOL_NAME)
 
+# '(parts, expect_none)' cases shared by the per-message converter tests
+REQUEST_PARTS_EXPECT_NONE = [
+    ([system_prompt_part], True),
+    ([user_prompt_part], False),
+    ([tool_return_part], True),
+    ([retry_prompt_part], True),
+    ([system_prompt_part, tool_return_part], True),
+    ([system_prompt_part, retry_prompt_part], True),
+    ([tool_return_part, retry_prompt_part], True),
+    ([system_prompt_part, tool_return_part, retry_prompt_part], True),
+    ([system_prompt_part, user_prompt_part], False),
+    ([tool_return_part, user_prompt_part], False),
+    ([retry_prompt_part, user_prompt_part], False),
+]
+RESPONSE_PARTS_EXPECT_NONE = [
+    ([text_part], False),
+    ([thinking_part, text_part], False),
+    ([tool_call_part, text_part], False),
+    ([thinking_part, tool_call_part, text_part], False),
+    ([thinking_part], True),
+    ([tool_call_part], True),
+    ([thinking_part, tool_call_part], True),
+]
 
-@pytest.mark.parametrize(
-    "parts, expect_none",
-    [
-        ([system_prompt_part], True),
-        ([user_prompt_part], False),
-        ([tool_return_part], True),
-        ([retry_prompt_part], True),
-        ([system_prompt_part, tool_return_part], True),
-        ([system_prompt_part, retry_prompt_part], True),
-        ([tool_return_part, retry_prompt_part], True),
-        ([system_prompt_part, tool_return_part, retry_prompt_part], True),
-        ([system_prompt_part, user_prompt_part], False),
-        ([tool_return_part, user_prompt_part], False),
-        ([retry_prompt_part, user_prompt_part], False),
-    ],
-)
+
+@pytest.mark.parametrize("parts, expect_none", REQUEST_PARTS_EXPECT_NONE)
 def test__to_convo_message_w_request(parts, expect_none):
     msg = ai_messages.ModelRequest(parts=parts)
 
@@ -148,18 +157,7 @@ def test__to_convo_message_w_request(parts, expect_none):
         assert found["timestamp"] == timestamp.isoformat()
 
 
-@pytest.mark.parametrize(
-    "parts, expect_none",
-    [
-        ([text_part], False),
-        ([thinking_part, text_part], False),
-        ([tool_call_part, text_part], False),
-        ([thinking_part, tool_call_part, text_part], False),
-        ([thinking_part], True),
-        ([tool_call_part], True),
-        ([thinking_part, tool_call_part], True),
-    ],
-)
+@pytest.mark.parametrize("parts, expect_none", RESPONSE_PARTS_EXPECT_NONE)
 def test__to_convo_message_w_response(parts, expect_none):
     msg = ai_messages.ModelResponse(parts=parts)
 
@@ -172,22 +170,7 @@ def test__to_convo_message_w_response(parts, expect_none):
         assert found["content"] == TEXT
 
 
-@pytest.mark.parametrize(
-    "parts, expect_none",
-    [
-        ([system_prompt_part], True),
-        ([user_prompt_part], False),
-        ([tool_return_part], True),
-        ([retry_prompt_part], True),
-        ([system_prompt_part, tool_return_part], True),
-        ([system_prompt_part, retry_prompt_part], True),
-        ([tool_return_part, retry_prompt_part], True),
-        ([system_prompt_part, tool_return_part, retry_prompt_part], True),
-        ([system_prompt_part, user_prompt_part], False),
-        ([tool_return_part, user_prompt_part], False),
-        ([retry_prompt_part, user_prompt_part], False),
-    ],
-)
+@pytest.mark.parametrize("parts, expect_none", REQUEST_PARTS_EXPECT_NONE)
 def test__to_convo_history_message_w_request(parts, expect_none):
     msg = ai_messages.ModelRequest(parts=parts)
 
@@ -201,18 +184,7 @@ def test__to_convo_history_message_w_request(parts, expect_none):
         assert found.timestamp == timestamp.isoformat()
 
 
-@pytest.mark.parametrize(
-    "parts, expect_none",
-    [
-        ([text_part], False),
-        ([thinking_part, text_part], False),
-        ([tool_call_part, text_part], False),
-        ([thinking_part, tool_call_part, text_part], False),
-        ([thinking_part], True),
-        ([tool_call_part], True),
-        ([thinking_part, tool_call_part], True),
-    ],
-)
+@pytest.mark.parametrize("parts, expect_none", RESPONSE_PARTS_EXPECT_NONE)
 def test__to_convo_history_message_w_response(parts, expect_none):
     msg = ai_messages.ModelResponse(parts=parts)
 
@@ -261,18 +233,7 @@ def test__filter_context_message_w_requests(parts, expect_len):
                 pass
 
 
-@pytest.mark.parametrize(
-    "parts, expect_none",
-    [
-        ([text_part], False),
-        ([thinking_part, text_part], False),
-        ([tool_call_part, text_part], False),
-        ([thinking_part, tool_call_part, text_part], False),
-        ([thinking_part], True),
-        ([tool_call_part], True),
-        ([thinking_part, tool_call_part], True),
-    ],
-)
+@pytest.mark.parametrize("parts, expect_none", RESPONSE_PARTS_EXPECT_NONE)
 def test__filter_context_message_w_responses(parts, expect_none):
     msg = ai_messages.ModelResponse(parts=parts)
 
@@ -303,22 +264,24 @@ def test__filter_context_messages():
 
 @pytest.mark.anyio
 @pytest.mark.parametrize("w_none", [False, True])
-@mock.patch("soliplex.convos._to_convo_history_message")
-async def test_conversation_message_history_dicts(tchm, w_none):
+async def test_conversation_message_history_dicts(monkeypatch, w_none):
+    tchm = mock.Mock()
+    monkeypatch.setattr(convos, "_to_convo_history_message", tchm)
+
     if w_none:
         tchm.return_value = None
 
-    found = [md for md in TEST_CONVO.message_history_dicts]
+    found = list(TEST_CONVO.message_history_dicts)
 
     if w_none:
         assert found == []
     else:
-        for f_dict, _e_msg in zip(
-            found,
-            OLD_AI_MESSAGES,
-            strict=True,
-        ):
-            assert f_dict is tchm.return_value
+        assert found == [tchm.return_value] * len(OLD_AI_MESSAGES)
+
+
+@pytest.fixture
+def the_convos():
+    return convos.Conversations()
 
 
 @pytest.mark.anyio
@@ -329,8 +292,11 @@ async def test_conversation_message_history_dicts(tchm, w_none):
         ({"testing": TEST_CONVOS}, TEST_CONVO_INFOS),
     ],
 )
-async def test_conversations_user_conversations(w_convos, expected):
-    the_convos = convos.Conversations()
+async def test_conversations_user_conversations(
+    the_convos,
+    w_convos,
+    expected,
+):
     the_convos._convos.update(w_convos)
 
     found = await the_convos.user_conversations("testing")
@@ -347,8 +313,11 @@ async def test_conversations_user_conversations(w_convos, expected):
         ({"testing": TEST_CONVOS}, contextlib.nullcontext(TEST_CONVO)),
     ],
 )
-async def test_conversations_get_conversation(w_convos, expectation):
-    the_convos = convos.Conversations()
+async def test_conversations_get_conversation(
+    the_convos,
+    w_convos,
+    expectation,
+):
     the_convos._convos.update(w_convos)
 
     with expectation as expected:
@@ -367,8 +336,11 @@ async def test_conversations_get_conversation(w_convos, expectation):
         ({"testing": TEST_CONVOS}, contextlib.nullcontext(TEST_CONVO_INFO)),
     ],
 )
-async def test_conversations_get_conversation_info(w_convos, expectation):
-    the_convos = convos.Conversations()
+async def test_conversations_get_conversation_info(
+    the_convos,
+    w_convos,
+    expectation,
+):
     the_convos._convos.update(w_convos)
 
     with expectation as expected:
@@ -382,40 +354,37 @@ async def test_conversations_get_conversation_info(w_convos, expectation):
 
 
 @pytest.mark.anyio
-@pytest.mark.parametrize("w_existing", [False, True])
 @pytest.mark.parametrize("w_user", [False, True])
-async def test_conversations_new_conversation(w_user, w_existing):
-    the_convos = convos.Conversations()
-
-    kw = {}
+async def test_conversations_new_conversation(
+    monkeypatch,
+    the_convos,
+    w_user,
+):
     if w_user:
-        kw["testing"] = {}
+        monkeypatch.setitem(the_convos._convos, "testing", {})
 
-    with (
-        mock.patch.dict(the_convos._convos, **kw),
-    ):
-        found = await the_convos.new_conversation(
-            "testing",
-            TEST_CONVO_ROOMID,
-            TEST_CONVO_NAME,
-            OLD_AI_MESSAGES,
-        )
+    found = await the_convos.new_conversation(
+        "testing",
+        TEST_CONVO_ROOMID,
+        TEST_CONVO_NAME,
+        OLD_AI_MESSAGES,
+    )
 
     assert isinstance(found.convo_uuid, uuid.UUID)
     assert found.name == TEST_CONVO_NAME
     assert found.room_id == TEST_CONVO_ROOMID
 
-    for f_msg, e_msg in zip(
-        found.message_history,
-        OLD_AI_MESSAGES,
-        strict=True,
-    ):
-        if isinstance(e_msg, ai_messages.ModelRequest):
-            assert f_msg.origin == "user"
-        else:
-            assert f_msg.origin == "llm"
-
-        assert f_msg.text == e_msg.parts[0].content
+    expected_history = [
+        (
+            "user" if isinstance(e_msg, ai_messages.ModelRequest) else "llm",
+            e_msg.parts[0].content,
+        )
+        for e_msg in OLD_AI_MESSAGES
+    ]
+    found_history = [
+        (f_msg.origin, f_msg.text) for f_msg in found.message_history
+    ]
+    assert found_history == expected_history
 
 
 @pytest.mark.anyio
@@ -427,9 +396,11 @@ async def test_conversations_new_conversation(w_user, w_existing):
         ({"testing": TEST_CONVOS}, contextlib.nullcontext(None)),
     ],
 )
-async def test_conversations_append_to_conversation(w_convos, expectation):
-    the_convos = convos.Conversations()
-
+async def test_conversations_append_to_conversation(
+    the_convos,
+    w_convos,
+    expectation,
+):
     for user_name, convo_map in list(w_convos.items()):
         new_map = {}
 
@@ -463,9 +434,11 @@ async def test_conversations_append_to_conversation(w_convos, expectation):
         ({"testing": TEST_CONVOS}, contextlib.nullcontext(None)),
     ],
 )
-async def test_conversations_delete_conversation(w_convos, expectation):
-    the_convos = convos.Conversations()
-
+async def test_conversations_delete_conversation(
+    the_convos,
+    w_convos,
+    expectation,
+):
     for user_name, convo_map in list(w_convos.items()):
         new_map = {}
 
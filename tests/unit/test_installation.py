@@ -4,9 +4,11 @@ from unittest import mock
 import fastapi
 import pytest
 
+from soliplex import agents
 from soliplex import config
 from soliplex import convos
 from soliplex import installation
+from soliplex import mcp_server
 from soliplex import secrets
 
 KEY = "test-key"
@@ -25,6 +27,36 @@ RaisesSecretError = pytest.raises(secrets.SecretError)
 NoRaise = contextlib.nullcontext()
 
 
+@pytest.fixture(scope="module")
+def shared_i_config():
+    return mock.create_autospec(config.InstallationConfig)
+
+
+@pytest.fixture
+def i_config(shared_i_config):
+    yield shared_i_config
+    shared_i_config.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def the_installation(shared_i_config):
+    return installation.Installation(shared_i_config)
+
+
+@pytest.fixture
+def gs(monkeypatch):
+    gs = mock.Mock()
+    monkeypatch.setattr(secrets, "get_secret", gs)
+    return gs
+
+
+@pytest.fixture
+def srs(monkeypatch):
+    srs = mock.Mock()
+    monkeypatch.setattr(secrets, "resolve_secrets", srs)
+    return srs
+
+
 @pytest.mark.parametrize(
     "secrets_map, expectation",
     [
@@ -32,13 +64,15 @@ NoRaise = contextlib.nullcontext()
         ({SECRET_NAME_1: SECRET_CONFIG_1}, NoRaise),
     ],
 )
-@mock.patch("soliplex.secrets.get_secret")
-def test_installation_get_secret(gs, secrets_map, expectation):
-    i_config = mock.create_autospec(
-        config.InstallationConfig,
-        secrets_map=secrets_map,
-    )
-    the_installation = installation.Installation(i_config)
+def test_installation_get_secret(
+    gs,
+    monkeypatch,
+    i_config,
+    the_installation,
+    secrets_map,
+    expectation,
+):
+    monkeypatch.setattr(i_config, "secrets_map", secrets_map)
 
     with mock.patch("os.environ", clear=True):
         with expectation as expected:
@@ -59,13 +93,16 @@ def test_installation_get_secret(gs, secrets_map, expectation):
         ([SECRET_CONFIG_1, SECRET_CONFIG_2], RaisesSecretError),
     ],
 )
-@mock.patch("soliplex.secrets.resolve_secrets")
-def test_installation_resolve_secrets(srs, secret_configs, expectation):
-    i_config = mock.create_autospec(
-        config.InstallationConfig,
-    )
-    i_config.secrets = secret_configs
-    the_installation = installation.Installation(i_config)
+def test_installation_resolve_secrets(
+    srs,
+    monkeypatch,
+    i_config,
+    the_installation,
+    secret_configs,
+    expectation,
+):
+    # No class-level default for this field, so the autospec lacks it
+    monkeypatch.setattr(i_config, "secrets", secret_configs, raising=False)
 
     with expectation as expected:
         if expected is not None:
@@ -77,10 +114,7 @@ def test_installation_resolve_secrets(srs, secret_configs, expectation):
 
 
 @pytest.mark.parametrize("w_default", [False, True])
-def test_installation_get_environment(w_default):
-    i_config = mock.create_autospec(config.InstallationConfig)
-    the_installation = installation.Installation(i_config)
-
+def test_installation_get_environment(i_config, the_installation, w_default):
     kwargs = {}
 
     if w_default:
@@ -97,9 +131,11 @@ def test_installation_get_environment(w_default):
 
 
 @pytest.mark.parametrize("w_raise", [False, True])
-def test_installation_resolve_environment(w_raise):
-    i_config = mock.create_autospec(config.InstallationConfig)
-
+def test_installation_resolve_environment(
+    i_config,
+    the_installation,
+    w_raise,
+):
     if w_raise:
         i_config.resolve_environment.side_effect = config.MissingEnvVars(
             "test1,test2",
@@ -111,8 +147,6 @@ def test_installation_resolve_environment(w_raise):
     else:
         i_config.resolve_environment.return_value = None
 
-    the_installation = installation.Installation(i_config)
-
     if w_raise:
         with pytest.raises(config.MissingEnvVars):
             the_installation.resolve_environment()
@@ -120,16 +154,21 @@ def test_installation_resolve_environment(w_raise):
         the_installation.resolve_environment()
 
 
-def test_installation_configure_haiku_rag():
+def test_installation_configure_haiku_rag(
+    monkeypatch,
+    i_config,
+    the_installation,
+):
     from haiku.rag import config as hr_config
 
     copied = hr_config.Config.model_copy()
 
-    i_config = mock.create_autospec(
-        config.InstallationConfig,
-        environment={"OLLAMA_BASE_URL": OLLAMA_BASE_URL},
+    monkeypatch.setattr(
+        i_config,
+        "environment",
+        {"OLLAMA_BASE_URL": OLLAMA_BASE_URL},
+        raising=False,
     )
-    the_installation = installation.Installation(i_config)
 
     with mock.patch("haiku.rag.config.Config", copied):
         the_installation.configure_haiku_rag()
@@ -140,105 +179,100 @@ def test_installation_configure_haiku_rag():
 
 
 @pytest.mark.parametrize("w_oidc_configs", [[], [object()]])
-def test_installation_auth_disabled(w_oidc_configs):
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.oidc_auth_system_configs = w_oidc_configs
-
-    the_installation = installation.Installation(i_config)
+def test_installation_auth_disabled(
+    monkeypatch,
+    i_config,
+    the_installation,
+    w_oidc_configs,
+):
+    monkeypatch.setattr(i_config, "oidc_auth_system_configs", w_oidc_configs)
 
     assert the_installation.auth_disabled == (not w_oidc_configs)
 
 
-def test_installation_oidc_auth_system_configs():
-    i_config = mock.create_autospec(config.InstallationConfig)
-    the_installation = installation.Installation(i_config)
-
+def test_installation_oidc_auth_system_configs(i_config, the_installation):
     assert (
         the_installation.oidc_auth_system_configs
         is i_config.oidc_auth_system_configs
     )
 
 
-def test_installation_get_room_configs():
-    r_config = mock.create_autospec(config.RoomConfig)
-    r_configs = {"room_id": r_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.room_configs = r_configs
-    test_user = {"name": "test"}
-
-    the_installation = installation.Installation(i_config)
-
-    assert the_installation.get_room_configs(test_user) == r_configs
-
-
 @pytest.mark.parametrize(
-    "w_room_id, raises", [("room_id", False), ("nonesuch", True)]
+    "kind, config_klass",
+    [
+        ("room", config.RoomConfig),
+        ("completion", config.CompletionConfig),
+    ],
 )
-def test_installation_get_room_config(w_room_id, raises):
-    r_config = mock.create_autospec(config.RoomConfig)
-    r_configs = {"room_id": r_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.room_configs = r_configs
-    test_user = {"name": "test"}
-
-    the_installation = installation.Installation(i_config)
-
-    if raises:
-        with pytest.raises(KeyError):
-            the_installation.get_room_config(w_room_id, test_user)
-    else:
-        found = the_installation.get_room_config(w_room_id, test_user)
-
-        assert found is r_config
-
-
-def test_installation_get_completion_configs():
-    c_config = mock.create_autospec(config.CompletionConfig)
-    c_configs = {"completion_id": c_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.completion_configs = c_configs
+def test_installation_get_configs(
+    monkeypatch,
+    i_config,
+    the_installation,
+    kind,
+    config_klass,
+):
+    the_config = mock.NonCallableMock(spec=config_klass)
+    the_configs = {f"{kind}_id": the_config}
+    monkeypatch.setattr(i_config, f"{kind}_configs", the_configs)
     test_user = {"name": "test"}
 
-    the_installation = installation.Installation(i_config)
+    get_configs = getattr(the_installation, f"get_{kind}_configs")
 
-    assert the_installation.get_completion_configs(test_user) == c_configs
+    assert get_configs(test_user) == the_configs
 
 
+@pytest.mark.parametrize("raises", [False, True])
 @pytest.mark.parametrize(
-    "w_completion_id, raises", [("completion_id", False), ("nonesuch", True)]
+    "kind, config_klass",
+    [
+        ("room", config.RoomConfig),
+        ("completion", config.CompletionConfig),
+    ],
 )
-def test_installation_get_completion_config(w_completion_id, raises):
-    c_config = mock.create_autospec(config.CompletionConfig)
-    c_configs = {"completion_id": c_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.completion_configs = c_configs
+def test_installation_get_config(
+    monkeypatch,
+    i_config,
+    the_installation,
+    kind,
+    config_klass,
+    raises,
+):
+    the_config = mock.NonCallableMock(spec=config_klass)
+    the_configs = {f"{kind}_id": the_config}
+    monkeypatch.setattr(i_config, f"{kind}_configs", the_configs)
     test_user = {"name": "test"}
 
-    the_installation = installation.Installation(i_config)
+    get_config = getattr(the_installation, f"get_{kind}_config")
 
     if raises:
         with pytest.raises(KeyError):
-            the_installation.get_completion_config(
-                w_completion_id,
-                test_user,
-            )
+            get_config("nonesuch", test_user)
     else:
-        found = the_installation.get_completion_configs(test_user)
+        found = get_config(f"{kind}_id", test_user)
+
+        assert found is the_config
 
-        assert found is c_configs
+
+@pytest.fixture
+def gafc(monkeypatch):
+    gafc = mock.Mock()
+    monkeypatch.setattr(agents, "get_agent_from_configs", gafc)
+    return gafc
 
 
 @pytest.mark.parametrize(
     "w_agent_id, raises", [("agent_id", False), ("nonesuch", True)]
 )
-@mock.patch("soliplex.agents.get_agent_from_configs")
-def test_installation_get_agent_by_id(gafc, w_agent_id, raises):
-    a_config = mock.create_autospec(config.AgentConfig)
-
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.agent_configs_map = {"agent_id": a_config}
-
-    the_installation = installation.Installation(i_config)
+def test_installation_get_agent_by_id(
+    gafc,
+    monkeypatch,
+    i_config,
+    the_installation,
+    w_agent_id,
+    raises,
+):
+    a_config = mock.NonCallableMock(spec=config.AgentConfig)
+    monkeypatch.setattr(i_config, "agent_configs_map", {"agent_id": a_config})
 
     if raises:
         with pytest.raises(KeyError):
@@ -249,105 +283,64 @@ def test_installation_get_agent_by_id(gafc, w_agent_id, raises):
         gafc.assert_called_once_with(a_config, {}, {})
 
 
+@pytest.mark.parametrize("raises", [False, True])
 @pytest.mark.parametrize(
-    "w_room_id, raises", [("room_id", False), ("nonesuch", True)]
-)
-@mock.patch("soliplex.agents.get_agent_from_configs")
-def test_installation_get_agent_for_room(gafc, w_room_id, raises):
-    a_config = mock.create_autospec(config.AgentConfig)
-
-    tc_config = mock.create_autospec(config.ToolConfig)
-    sdtc_config = mock.create_autospec(config.SearchDocumentsToolConfig)
-
-    mcp_stdio_config = mock.create_autospec(
-        config.Stdio_MCP_ClientToolsetConfig
-    )
-    mcp_http_streaming_config = mock.create_autospec(
-        config.HTTP_MCP_ClientToolsetConfig
-    )
-
-    r_config = mock.create_autospec(config.RoomConfig)
-    r_config.agent_config = a_config
-    t_configs = r_config.tool_configs = {
-        "test_tool": tc_config,
-        "test_sdtc": sdtc_config,
-    }
-    mcp_configs = r_config.mcp_client_toolset_configs = {
-        "test_stdio": mcp_stdio_config,
-        "test_http": mcp_http_streaming_config,
-    }
-
-    r_configs = {"room_id": r_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.room_configs = r_configs
-    test_user = {"name": "test"}
-
-    the_installation = installation.Installation(i_config)
-
-    if raises:
-        with pytest.raises(KeyError):
-            the_installation.get_agent_for_room(w_room_id, test_user)
-    else:
-        found = the_installation.get_agent_for_room(w_room_id, test_user)
-        assert found is gafc.return_value
-        gafc.assert_called_once_with(a_config, t_configs, mcp_configs)
-
-
-@pytest.mark.parametrize(
-    "w_completion_id, raises", [("completion_id", False), ("nonesuch", True)]
+    "kind, config_klass",
+    [
+        ("room", config.RoomConfig),
+        ("completion", config.CompletionConfig),
+    ],
 )
-@mock.patch("soliplex.agents.get_agent_from_configs")
-def test_installation_get_agent_for_completion(gafc, w_completion_id, raises):
-    a_config = mock.create_autospec(config.AgentConfig)
+def test_installation_get_agent_for_config(
+    gafc,
+    monkeypatch,
+    i_config,
+    the_installation,
+    kind,
+    config_klass,
+    raises,
+):
+    a_config = mock.NonCallableMock(spec=config.AgentConfig)
 
-    tc_config = mock.create_autospec(config.ToolConfig)
-    sdtc_config = mock.create_autospec(config.SearchDocumentsToolConfig)
+    tc_config = mock.NonCallableMock(spec=config.ToolConfig)
+    sdtc_config = mock.NonCallableMock(spec=config.SearchDocumentsToolConfig)
 
-    mcp_stdio_config = mock.create_autospec(
-        config.Stdio_MCP_ClientToolsetConfig
+    mcp_stdio_config = mock.NonCallableMock(
+        spec=config.Stdio_MCP_ClientToolsetConfig
     )
-    mcp_http_streaming_config = mock.create_autospec(
-        config.HTTP_MCP_ClientToolsetConfig
+    mcp_http_streaming_config = mock.NonCallableMock(
+        spec=config.HTTP_MCP_ClientToolsetConfig
     )
 
-    r_config = mock.create_autospec(config.RoomConfig)
-    r_config.agent_config = a_config
-    t_configs = r_config.tool_configs = {
+    the_config = mock.NonCallableMock(spec=config_klass)
+    the_config.agent_config = a_config
+    t_configs = the_config.tool_configs = {
         "test_tool": tc_config,
         "test_sdtc": sdtc_config,
     }
-    mcp_configs = r_config.mcp_client_toolset_configs = {
+    mcp_configs = the_config.mcp_client_toolset_configs = {
         "test_stdio": mcp_stdio_config,
         "test_http": mcp_http_streaming_config,
     }
 
-    r_configs = {"completion_id": r_config}
-    i_config = mock.create_autospec(config.InstallationConfig)
-    i_config.completion_configs = r_configs
+    the_configs = {f"{kind}_id": the_config}
+    monkeypatch.setattr(i_config, f"{kind}_configs", the_configs)
     test_user = {"name": "test"}
 
-    the_installation = installation.Installation(i_config)
+    get_agent = getattr(the_installation, f"get_agent_for_{kind}")
 
     if raises:
         with pytest.raises(KeyError):
-            the_installation.get_agent_for_completion(
-                w_completion_id,
-                test_user,
-            )
+            get_agent("nonesuch", test_user)
     else:
-        found = the_installation.get_agent_for_completion(
-            w_completion_id,
-            test_user,
-        )
+        found = get_agent(f"{kind}_id", test_user)
         assert found is gafc.return_value
         gafc.assert_called_once_with(a_config, t_configs, mcp_configs)
 
 
 @pytest.mark.anyio
-async def test_get_the_installation():
-    i_config = mock.create_autospec(config.InstallationConfig)
-    the_installation = installation.Installation(i_config)
-    request = mock.create_autospec(fastapi.Request)
+async def test_get_the_installation(the_installation):
+    request = fastapi.Request(scope={"type": "http"})
     request.state.the_installation = the_installation
 
     found = await installation.get_the_installation(request)
@@ -369,6 +362,20 @@ def mcp_apps():
     return {key: _mock_mcp_app(key) for key in ["room1", "room2"]}
 
 
+@pytest.fixture
+def smfr(monkeypatch):
+    smfr = mock.Mock()
+    monkeypatch.setattr(mcp_server, "setup_mcp_for_rooms", smfr)
+    return smfr
+
+
+@pytest.fixture
+def load_installation(monkeypatch):
+    load_installation = mock.Mock()
+    monkeypatch.setattr(config, "load_installation", load_installation)
+    return load_installation
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "w_no_auth_mode, exp_oidc_paths",
@@ -378,9 +385,6 @@ def mcp_apps():
         (True, []),
     ],
 )
-@mock.patch("soliplex.secrets.resolve_secrets")
-@mock.patch("soliplex.mcp_server.setup_mcp_for_rooms")
-@mock.patch("soliplex.config.load_installation")
 async def test_lifespan(
     load_installation,
     smfr,
@@ -410,23 +414,19 @@ async def test_lifespan(
     if w_no_auth_mode is not None:
         kwargs["no_auth_mode"] = w_no_auth_mode
 
+    lifespan_gen = installation.lifespan(app, INSTALLATION_PATH, **kwargs)
+
     with mock.patch("haiku.rag.config.Config", copied):
-        found = [
-            item
-            async for item in installation.lifespan(
-                app,
-                INSTALLATION_PATH,
-                **kwargs,
-            )
-        ]
+        found = await anext(lifespan_gen)
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(lifespan_gen)
 
     # Check that the 'haiku.rag.config.Config' object was reconfigured
     # using our config's environment.
     assert copied.OLLAMA_BASE_URL == OLLAMA_BASE_URL
 
-    assert len(found) == 1
-
-    the_installation = found[0]["the_installation"]
+    the_installation = found["the_installation"]
     assert isinstance(the_installation, installation.Installation)
     assert the_installation._config is i_config
 
@@ -436,7 +436,7 @@ async def test_lifespan(
 
     load_installation.assert_called_once_with(INSTALLATION_PATH)
 
-    the_convos = found[0]["the_convos"]
+    the_convos = found["the_convos"]
     assert isinstance(the_convos, convos.Conversations)
 
     for f_call, (key, mcp_app) in zip(